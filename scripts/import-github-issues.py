@@ -7,25 +7,67 @@ Usage:
     python import-github-issues.py [--dry-run] [--project PROJECT]
 
 Environment Variables:
-    YOUTRACK_URL    - YouTrack instance URL (required)
-    YOUTRACK_TOKEN  - API token (required)
+    YOUTRACK_URL       - YouTrack instance URL (required)
+    YOUTRACK_TOKEN     - API token (required)
+    GITHUB_TOKEN       - GitHub API token (or GH_TOKEN; falls back to
+                         `gh auth token`)
+    GITHUB_REPOSITORY  - GitHub repository as owner/repo (default: parsed
+                         from the git remote "origin")
 
 Requires:
-    - gh CLI authenticated with repo access
-    - httpx package
+    - GitHub token with repo access (or an authenticated gh CLI)
+    - httpx package with HTTP/2 support (pip install 'httpx[http2]')
+    - orjson package
 """
 
 from __future__ import annotations
 
 import argparse
-import json
+import asyncio
 import os
+import random
+import re
 import subprocess
 import sys
-from dataclasses import dataclass
+import time
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
 import httpx
+import orjson
+
+# Transient YouTrack responses worth retrying, and the retry budget
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+MAX_ATTEMPTS = 4
+MAX_BACKOFF = 10.0
+# Upper bound on a server-requested Retry-After wait
+MAX_RETRY_AFTER = 300.0
+
+# POST isn't idempotent: only retry failures where the server can't have
+# acted on the request (no connection, or explicitly rejected before handling)
+NON_IDEMPOTENT_METHODS = frozenset({"POST", "PATCH"})
+POST_RETRY_STATUS_CODES = frozenset({429, 503})
+POST_RETRY_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+# GitHub signals rate limiting with 429, or 403 plus rate limit headers
+GITHUB_RATE_LIMIT_STATUS_CODES = frozenset({403, 429})
+
+# Static request parts, built once and shared by every import
+CREATE_ISSUE_PARAMS = {"fields": "id,idReadable,summary"}
+COMMANDS_URL = "/commands"
+
+# Project short name -> database ID lookups persisted across runs
+PROJECT_CACHE_PATH = (
+    Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "mcp-youtrack" / "projects.json"
+)
+
+
+class GitHubFetchError(Exception):
+    """Listing GitHub issues failed partway through pagination."""
 
 
 @dataclass
@@ -55,52 +97,137 @@ def get_youtrack_config() -> tuple[str, str]:
     return url.rstrip("/"), token
 
 
-def fetch_github_issues() -> list[GitHubIssue]:
-    """Fetch open issues from GitHub using gh CLI."""
-    print("Fetching GitHub issues...")
+def get_github_config() -> tuple[str, str]:
+    """Get the GitHub repository (owner/repo) and API token.
 
-    try:
-        result = subprocess.run(
-            [
-                "gh",
-                "issue",
-                "list",
-                "--state",
-                "open",
-                "--json",
-                "number,title,body,labels,state,url",
-                "--limit",
-                "100",
-            ],
-            capture_output=True,
-            text=True,
-            check=True,
+    The token is read from GITHUB_TOKEN or GH_TOKEN, falling back to a
+    single `gh auth token` call. The repository is read from
+    GITHUB_REPOSITORY, falling back to the git remote "origin".
+    """
+    token = os.getenv("GITHUB_TOKEN") or os.getenv("GH_TOKEN")
+    if not token:
+        try:
+            token = subprocess.run(
+                ["gh", "auth", "token"],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            token = ""
+    if not token:
+        print(
+            "Error: GITHUB_TOKEN environment variable is required (or an authenticated gh CLI)",
+            file=sys.stderr,
         )
-    except subprocess.CalledProcessError as e:
-        print(f"Error fetching GitHub issues: {e.stderr}", file=sys.stderr)
         sys.exit(1)
-    except FileNotFoundError:
-        print("Error: gh CLI not found. Install GitHub CLI first.", file=sys.stderr)
+
+    repo = os.getenv("GITHUB_REPOSITORY")
+    if not repo:
+        try:
+            remote_url = subprocess.run(
+                ["git", "config", "--get", "remote.origin.url"],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            remote_url = ""
+        match = re.search(r"github\.com[:/]([^/]+/[^/]+?)(?:\.git)?/?$", remote_url)
+        if match:
+            repo = match.group(1)
+    if not repo:
+        print(
+            "Error: Could not determine GitHub repository; set GITHUB_REPOSITORY=owner/repo",
+            file=sys.stderr,
+        )
         sys.exit(1)
 
-    issues_data = json.loads(result.stdout)
-    issues: list[GitHubIssue] = []
+    return repo, token
+
+
+def create_youtrack_client(url: str, token: str) -> httpx.AsyncClient:
+    """Create the YouTrack API client shared by all imports."""
+    return httpx.AsyncClient(
+        base_url=f"{url}/api",
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        },
+        timeout=30,
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=30,
+        ),
+    )
+
+
+def create_github_client(repo: str, token: str) -> httpx.AsyncClient:
+    """Create a GitHub REST API client scoped to the repository."""
+    return httpx.AsyncClient(
+        base_url=f"https://api.github.com/repos/{repo}",
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        },
+        timeout=30,
+        http2=True,
+    )
+
+
+async def iter_github_issues(client: httpx.AsyncClient) -> AsyncIterator[GitHubIssue]:
+    """Yield open GitHub issues page by page, following pagination links.
+
+    Issues are yielded as soon as their page is parsed, so callers can
+    start working on the first page while later pages are still in flight.
+
+    Raises:
+        GitHubFetchError: If a page request fails. Issues from earlier pages
+            have already been yielded.
+    """
+    print("Fetching GitHub issues...")
+
+    count = 0
+    url: str | None = "/issues"
+    params: dict[str, Any] | None = {"state": "open", "per_page": 100}
 
-    for item in issues_data:
-        labels = [label["name"] for label in item.get("labels", [])]
-        issues.append(
-            GitHubIssue(
+    while url:
+        try:
+            response = await client.get(url, params=params)
+        except httpx.HTTPError as e:
+            raise GitHubFetchError(f"Error fetching GitHub issues: {e}") from e
+
+        if not response.is_success:
+            raise GitHubFetchError(f"Error fetching GitHub issues: {response.text}")
+
+        for item in orjson.loads(response.content):
+            # The issues endpoint also returns pull requests
+            if "pull_request" in item:
+                continue
+            count += 1
+            yield GitHubIssue(
                 number=item["number"],
                 title=item["title"],
                 body=item.get("body"),
-                labels=labels,
+                labels=[label["name"] for label in item.get("labels", [])],
                 state=item["state"],
-                url=item["url"],
+                url=item["html_url"],
             )
-        )
 
-    print(f"Found {len(issues)} open issues")
-    return issues
+        # The next link already carries the query string
+        url = response.links.get("next", {}).get("url")
+        params = None
+
+    print(f"Found {count} open issues")
+
+
+async def fetch_github_issues(client: httpx.AsyncClient) -> list[GitHubIssue]:
+    """Fetch all open issues from GitHub."""
+    return [issue async for issue in iter_github_issues(client)]
 
 
 def map_labels_to_domain(labels: list[str], domain_map: dict[str, str]) -> str | None:
@@ -108,25 +235,73 @@ def map_labels_to_domain(labels: list[str], domain_map: dict[str, str]) -> str |
 
     Args:
         labels: List of GitHub labels
-        domain_map: Mapping from label names to domain values
+        domain_map: Mapping from lowercase label names to domain values
+            (see normalize_domain_map)
 
     Returns:
         Domain value if found, None otherwise
     """
     for label in labels:
-        label_lower = label.lower()
-        if label_lower in domain_map:
-            return domain_map[label_lower]
+        domain = domain_map.get(label.lower())
+        if domain:
+            return domain
 
     return None
 
 
-def create_youtrack_issue(
-    client: httpx.Client,
+def normalize_domain_map(domain_map: dict[str, str]) -> dict[str, str]:
+    """Lowercase the label keys of a domain mapping once, up front."""
+    return {label.lower(): domain for label, domain in domain_map.items()}
+
+
+def _retry_delay(attempt: int, response: httpx.Response | None = None) -> float:
+    """Get the delay before the next attempt, honoring Retry-After."""
+    if response is not None:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), MAX_RETRY_AFTER)
+    backoff: float = min(0.5 * 2**attempt, MAX_BACKOFF)
+    return backoff + random.uniform(0, backoff / 2)
+
+
+async def send_with_retry(
+    client: httpx.AsyncClient,
+    request: httpx.Request,
+) -> httpx.Response:
+    """Send a prebuilt request, retrying transient failures with backoff.
+
+    Idempotent requests retry any transport error and 429/5xx gateway
+    responses. POST/PATCH only retry connection failures and 429/503, since
+    a timeout or gateway error may arrive after YouTrack already created
+    the issue. Up to MAX_ATTEMPTS attempts are made, resending the same
+    request object; the final response (or error) is returned unchanged.
+    """
+    if request.method in NON_IDEMPOTENT_METHODS:
+        retry_errors: tuple[type[httpx.TransportError], ...] = POST_RETRY_ERRORS
+        retry_statuses = POST_RETRY_STATUS_CODES
+    else:
+        retry_errors = (httpx.TransportError,)
+        retry_statuses = RETRY_STATUS_CODES
+
+    for attempt in range(MAX_ATTEMPTS - 1):
+        try:
+            response = await client.send(request)
+        except retry_errors:
+            await asyncio.sleep(_retry_delay(attempt))
+            continue
+
+        if response.status_code not in retry_statuses:
+            return response
+        await asyncio.sleep(_retry_delay(attempt, response))
+
+    return await client.send(request)
+
+
+async def create_youtrack_issue(
+    client: httpx.AsyncClient,
     project_id: str,
     title: str,
     description: str | None,
-    domain: str | None = None,
 ) -> dict[str, Any]:
     """Create an issue in YouTrack."""
     payload: dict[str, Any] = {
@@ -137,57 +312,315 @@ def create_youtrack_issue(
     if description:
         payload["description"] = description
 
-    response = client.post(
+    request = client.build_request(
+        "POST",
         "/issues",
-        json=payload,
-        params={"fields": "id,idReadable,summary"},
+        content=orjson.dumps(payload),
+        params=CREATE_ISSUE_PARAMS,
     )
+    response = await send_with_retry(client, request)
 
-    if not response.is_success:
-        raise Exception(f"Failed to create issue: {response.text}")
+    response.raise_for_status()
 
-    issue = response.json()
+    issue: dict[str, Any] = orjson.loads(response.content)
+    return issue
 
-    # Set domain via command if specified
-    if domain:
-        command_payload = {
-            "query": f"Domain: {domain}",
-            "issues": [{"idReadable": issue["idReadable"]}],
-        }
-        client.post("/commands", json=command_payload)
 
-    return issue
+async def set_domain(
+    client: httpx.AsyncClient,
+    domain: str,
+    issue_ids: list[str],
+) -> None:
+    """Set the Domain field on a bucket of issues with one command.
+
+    Raises:
+        httpx.HTTPStatusError: If the command is rejected.
+    """
+    command_payload = {
+        "query": f"Domain: {domain}",
+        "issues": [{"idReadable": issue_id} for issue_id in issue_ids],
+    }
+    request = client.build_request(
+        "POST",
+        COMMANDS_URL,
+        content=orjson.dumps(command_payload),
+    )
+    response = await send_with_retry(client, request)
+    response.raise_for_status()
+    print(f"Set Domain '{domain}' on {len(issue_ids)} issues")
+
+
+async def set_domains(
+    client: httpx.AsyncClient,
+    by_domain: dict[str, list[str]],
+) -> list[tuple[str, str]]:
+    """Set the Domain field with one command per domain bucket.
+
+    The commands endpoint accepts many issues per call, so every issue
+    sharing a domain is updated in a single request, and the buckets are
+    dispatched concurrently.
+
+    Returns:
+        List of (domain, error) tuples for buckets that failed.
+    """
+    results = await asyncio.gather(
+        *(set_domain(client, domain, issue_ids) for domain, issue_ids in by_domain.items()),
+        return_exceptions=True,
+    )
+
+    failures: list[tuple[str, str]] = []
+    for domain, result in zip(by_domain, results, strict=True):
+        if isinstance(result, httpx.HTTPStatusError):
+            failures.append((domain, result.response.text))
+        elif isinstance(result, BaseException):
+            failures.append((domain, str(result)))
+
+    return failures
+
+
+def _github_rate_limited(response: httpx.Response) -> bool:
+    """Whether GitHub rejected a request for rate limiting (so it wasn't applied)."""
+    if response.status_code not in GITHUB_RATE_LIMIT_STATUS_CODES:
+        return False
+    # A plain 403 is a permission error, not worth retrying
+    return (
+        response.status_code == 429
+        or "Retry-After" in response.headers
+        or response.headers.get("x-ratelimit-remaining") == "0"
+    )
 
 
-def add_github_comment(issue_number: int, youtrack_id: str) -> bool:
-    """Add a comment on the GitHub issue noting migration."""
+def _github_retry_delay(attempt: int, response: httpx.Response) -> float:
+    """Get the delay before retrying a rate-limited GitHub request.
+
+    Prefers Retry-After, then the x-ratelimit-reset time, then backoff; never
+    more than MAX_RETRY_AFTER.
+    """
+    reset = response.headers.get("x-ratelimit-reset", "")
+    if "Retry-After" not in response.headers and reset.isdigit():
+        return min(max(0.0, int(reset) - time.time()), MAX_RETRY_AFTER)
+    return _retry_delay(attempt, response)
+
+
+async def add_github_comment(
+    client: httpx.AsyncClient,
+    issue_number: int,
+    youtrack_id: str,
+) -> bool:
+    """Add a comment on the GitHub issue noting migration.
+
+    Only rate-limited responses are retried, since GitHub didn't create the
+    comment; a transport error may have, so it is reported as a failure.
+    """
     comment = f"Migrated to YouTrack: {youtrack_id}"
 
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            response = await client.post(
+                f"/issues/{issue_number}/comments",
+                json={"body": comment},
+            )
+        except httpx.HTTPError:
+            return False
+
+        if not _github_rate_limited(response):
+            return response.is_success
+        if attempt < MAX_ATTEMPTS - 1:
+            await asyncio.sleep(_github_retry_delay(attempt, response))
+
+    return False
+
+
+def _load_project_cache() -> dict[str, dict[str, str]]:
+    """Load the on-disk project ID cache, keyed by API URL then short name."""
     try:
-        subprocess.run(
-            ["gh", "issue", "comment", str(issue_number), "--body", comment],
-            capture_output=True,
-            check=True,
-        )
-        return True
-    except subprocess.CalledProcessError:
-        return False
+        with open(PROJECT_CACHE_PATH, "rb") as f:
+            data = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    # Drop malformed per-instance entries rather than failing on them later
+    return {url: names for url, names in data.items() if isinstance(names, dict)}
+
+
+def _save_project_cache(cache: dict[str, dict[str, str]]) -> None:
+    """Atomically write the project ID cache, ignoring write failures."""
+    try:
+        PROJECT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = PROJECT_CACHE_PATH.with_suffix(".tmp")
+        tmp_path.write_bytes(orjson.dumps(cache))
+        os.replace(tmp_path, PROJECT_CACHE_PATH)
+    except OSError as e:
+        print(f"Warning: Could not write project cache: {e}", file=sys.stderr)
+
+
+def _forget_project_id(client: httpx.AsyncClient, short_name: str) -> None:
+    """Drop a cached project ID, e.g. after the project was deleted or renamed."""
+    cache = _load_project_cache()
+    if cache.get(str(client.base_url), {}).pop(short_name, None) is not None:
+        _save_project_cache(cache)
+
+
+async def get_project_id(
+    client: httpx.AsyncClient, short_name: str, *, use_cache: bool = True
+) -> tuple[str, bool]:
+    """Get the project database ID from short name.
 
+    Project IDs never change, so lookups are cached on disk across runs.
+    A cached ID can still go stale if the project is deleted or renamed;
+    see ImportTarget.refresh.
 
-def get_project_id(client: httpx.Client, short_name: str) -> str:
-    """Get the project database ID from short name."""
-    response = client.get(
+    Returns:
+        Tuple of (project ID, whether it came from the cache).
+    """
+    cache = _load_project_cache()
+    instance_cache = cache.setdefault(str(client.base_url), {})
+    if use_cache and short_name in instance_cache:
+        return instance_cache[short_name], True
+
+    response = await client.get(
         f"/admin/projects/{short_name}",
         params={"fields": "id,shortName"},
     )
 
     if not response.is_success:
+        if response.status_code == 404 and short_name in instance_cache:
+            del instance_cache[short_name]
+            _save_project_cache(cache)
         raise Exception(f"Project '{short_name}' not found: {response.text}")
 
-    return response.json()["id"]
+    project_id: str = orjson.loads(response.content)["id"]
+    instance_cache[short_name] = project_id
+    _save_project_cache(cache)
+    return project_id, False
+
+
+@dataclass
+class ImportTarget:
+    """YouTrack project that issues are imported into.
+
+    If the ID came from the on-disk cache, a rejected create triggers one
+    fresh lookup, shared by all concurrent imports.
+    """
+
+    client: httpx.AsyncClient
+    short_name: str
+    project_id: str
+    from_cache: bool
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    async def refresh(self, stale_id: str) -> str | None:
+        """Re-resolve a cached project ID that a create call rejected.
+
+        Returns:
+            A different project ID to retry with, or None if there is nothing
+            new to try (the ID was already looked up fresh, or didn't change).
+        """
+        async with self.lock:
+            if self.project_id != stale_id:
+                # Another import already refreshed it
+                return self.project_id
+            if not self.from_cache:
+                return None
+            _forget_project_id(self.client, self.short_name)
+            self.project_id, self.from_cache = await get_project_id(
+                self.client, self.short_name, use_cache=False
+            )
+            print(f"Refreshed cached project ID: {self.short_name} ({self.project_id})")
+            return self.project_id if self.project_id != stale_id else None
+
+
+@dataclass
+class GitHubCommenter:
+    """Posts migration comments to GitHub one at a time.
+
+    GitHub rate limits content creation per account, so comments are
+    serialized here rather than sharing the YouTrack concurrency limit.
+    """
+
+    client: httpx.AsyncClient
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    async def post(self, issue_number: int, youtrack_id: str) -> bool:
+        """Add the migration comment, waiting for any comment in progress."""
+        async with self.lock:
+            return await add_github_comment(self.client, issue_number, youtrack_id)
+
+
+async def _import_one(
+    sem: asyncio.Semaphore,
+    client: httpx.AsyncClient,
+    target: ImportTarget,
+    issue: GitHubIssue,
+    domain_map: dict[str, str],
+    commenter: GitHubCommenter | None,
+    mapping: dict[int, str],
+    errors: list[tuple[int, str]],
+    by_domain: dict[str, list[str]],
+) -> None:
+    """Import a single GitHub issue, bounded by the shared semaphore.
+
+    The GitHub migration comment is posted after the YouTrack slot is
+    released, so a rate-limited comment doesn't hold up other imports.
+    """
+    domain = map_labels_to_domain(issue.labels, domain_map)
+
+    # Build description with original GitHub reference
+    description_parts: list[str] = []
+    if issue.body:
+        description_parts.append(issue.body)
+    description_parts.append(f"\n\n---\n*Migrated from GitHub: {issue.url}*")
+    description = "\n".join(description_parts)
+
+    async with sem:
+        try:
+            project_id = target.project_id
+            try:
+                yt_issue = await create_youtrack_issue(
+                    client,
+                    project_id,
+                    issue.title,
+                    description,
+                )
+            except httpx.HTTPStatusError as e:
+                # A stale cached project ID is rejected as 400/404; retry once
+                if e.response.status_code not in (400, 404):
+                    raise
+                retry_id = await target.refresh(project_id)
+                if retry_id is None:
+                    raise
+                yt_issue = await create_youtrack_issue(
+                    client,
+                    retry_id,
+                    issue.title,
+                    description,
+                )
+            yt_id = yt_issue["idReadable"]
+            mapping[issue.number] = yt_id
+            if domain:
+                by_domain[domain].append(yt_id)
+            print(f"Created: #{issue.number} -> {yt_id}")
+
+        except httpx.HTTPStatusError as e:
+            message = f"Failed to create issue: {e.response.text}"
+            errors.append((issue.number, message))
+            print(f"Error importing #{issue.number}: {message}")
+            return
+        except Exception as e:
+            errors.append((issue.number, str(e)))
+            print(f"Error importing #{issue.number}: {e}")
+            return
+
+    # Add comment to GitHub issue
+    if commenter is not None:
+        if await commenter.post(issue.number, yt_id):
+            print(f"  Added migration comment to GitHub #{issue.number}")
+        else:
+            print(f"  Warning: Could not add comment to GitHub #{issue.number}")
 
 
-def main() -> None:
+async def main() -> None:
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Import GitHub issues to YouTrack")
     parser.add_argument(
@@ -210,108 +643,131 @@ def main() -> None:
         type=str,
         help="JSON file containing label-to-domain mapping",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        help="Maximum number of issues to import in parallel (default: 10)",
+    )
     args = parser.parse_args()
 
     url, token = get_youtrack_config()
+    repo, gh_token = get_github_config()
 
     # Load domain mapping if provided
     domain_map: dict[str, str] = {}
     if args.domain_map:
         try:
-            with open(args.domain_map) as f:
-                domain_map = json.load(f)
+            with open(args.domain_map, "rb") as f:
+                domain_map = normalize_domain_map(orjson.loads(f.read()))
             print(f"Loaded domain mapping from {args.domain_map}")
         except Exception as e:
             print(f"Warning: Could not load domain mapping: {e}", file=sys.stderr)
 
-    # Fetch GitHub issues first
-    issues = fetch_github_issues()
-
-    if not issues:
-        print("No open issues to import")
-        return
-
-    if args.dry_run:
-        print("\n=== DRY RUN - No changes will be made ===\n")
-        for issue in issues:
-            domain = map_labels_to_domain(issue.labels, domain_map)
-            print(f"Would import: #{issue.number} - {issue.title}")
-            print(f"  Labels: {', '.join(issue.labels) or '(none)'}")
-            print(f"  Domain: {domain or '(none)'}")
-            print()
-        print(f"Total: {len(issues)} issues would be imported")
-        return
-
-    # Create YouTrack client
-    with httpx.Client(
-        base_url=f"{url}/api",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        },
-        timeout=30,
-    ) as client:
+    async with AsyncExitStack() as stack:
+        # Create GitHub client, shared by issue listing and migration comments
+        gh_client = await stack.enter_async_context(create_github_client(repo, gh_token))
+
+        if args.dry_run:
+            try:
+                issues = await fetch_github_issues(gh_client)
+            except GitHubFetchError as e:
+                print(e, file=sys.stderr)
+                sys.exit(1)
+
+            if not issues:
+                print("No open issues to import")
+                return
+
+            print("\n=== DRY RUN - No changes will be made ===\n")
+            for issue in issues:
+                domain = map_labels_to_domain(issue.labels, domain_map)
+                print(f"Would import: #{issue.number} - {issue.title}")
+                print(f"  Labels: {', '.join(issue.labels) or '(none)'}")
+                print(f"  Domain: {domain or '(none)'}")
+                print()
+            print(f"Total: {len(issues)} issues would be imported")
+            return
+
+        # Create YouTrack client
+        client = await stack.enter_async_context(create_youtrack_client(url, token))
+
         # Get project ID
         try:
-            project_id = get_project_id(client, args.project)
+            project_id, from_cache = await get_project_id(client, args.project)
             print(f"Target project: {args.project} ({project_id})")
         except Exception as e:
             print(f"Error: {e}", file=sys.stderr)
             sys.exit(1)
 
-        # Import each issue
+        # Import issues concurrently as pages arrive, bounded by --concurrency
         mapping: dict[int, str] = {}
         errors: list[tuple[int, str]] = []
+        by_domain: dict[str, list[str]] = defaultdict(list)
 
-        for issue in issues:
-            domain = map_labels_to_domain(issue.labels, domain_map)
-
-            # Build description with original GitHub reference
-            description_parts: list[str] = []
-            if issue.body:
-                description_parts.append(issue.body)
-            description_parts.append(f"\n\n---\n*Migrated from GitHub: {issue.url}*")
-            description = "\n".join(description_parts)
-
-            try:
-                yt_issue = create_youtrack_issue(
-                    client,
-                    project_id,
-                    issue.title,
-                    description,
-                    domain,
+        target = ImportTarget(client, args.project, project_id, from_cache)
+        sem = asyncio.Semaphore(max(1, args.concurrency))
+        commenter = None if args.skip_comment else GitHubCommenter(gh_client)
+        tasks: list[asyncio.Task[None]] = []
+        fetch_error: GitHubFetchError | None = None
+        try:
+            async for issue in iter_github_issues(gh_client):
+                tasks.append(
+                    asyncio.create_task(
+                        _import_one(
+                            sem,
+                            client,
+                            target,
+                            issue,
+                            domain_map,
+                            commenter,
+                            mapping,
+                            errors,
+                            by_domain,
+                        )
+                    )
                 )
-                yt_id = yt_issue["idReadable"]
-                mapping[issue.number] = yt_id
-                print(f"Created: #{issue.number} -> {yt_id}")
+        except GitHubFetchError as e:
+            # Stop queueing, but let started imports finish so the summary and
+            # domain updates still cover every issue that was created
+            fetch_error = e
+            print(f"{e}\nStopping after {len(tasks)} queued issues", file=sys.stderr)
+
+        if not tasks:
+            if fetch_error is not None:
+                sys.exit(1)
+            print("No open issues to import")
+            return
 
-                # Add comment to GitHub issue
-                if not args.skip_comment:
-                    if add_github_comment(issue.number, yt_id):
-                        print(f"  Added migration comment to GitHub #{issue.number}")
-                    else:
-                        print(f"  Warning: Could not add comment to GitHub #{issue.number}")
+        await asyncio.gather(*tasks)
 
-            except Exception as e:
-                errors.append((issue.number, str(e)))
-                print(f"Error importing #{issue.number}: {e}")
+        # Set domains in bulk, one command per domain
+        domain_errors = await set_domains(client, by_domain)
 
         # Summary
         print("\n=== Import Summary ===")
         print(f"Imported: {len(mapping)} issues")
         print(f"Errors: {len(errors)} issues")
 
+        # Write each block in one call rather than one print per line
         if mapping:
             print("\nMapping (GitHub -> YouTrack):")
-            for gh_num, yt_id in sorted(mapping.items()):
-                print(f"  #{gh_num} -> {yt_id}")
+            sys.stdout.write(
+                "".join(f"  #{gh_num} -> {yt_id}\n" for gh_num, yt_id in sorted(mapping.items()))
+            )
 
         if errors:
             print("\nFailed imports:")
-            for gh_num, error in errors:
-                print(f"  #{gh_num}: {error}")
+            sys.stdout.write("".join(f"  #{gh_num}: {error}\n" for gh_num, error in sorted(errors)))
+
+        if domain_errors:
+            print("\nFailed domain updates:")
+            sys.stdout.write("".join(f"  {domain}: {error}\n" for domain, error in domain_errors))
+
+        if fetch_error is not None:
+            print(f"\nIncomplete import: {fetch_error}")
+            sys.exit(1)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
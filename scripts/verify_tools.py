@@ -23,10 +23,15 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import orjson
+
+if TYPE_CHECKING:
+    from mcp_youtrack.client import YouTrackClient
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -42,8 +47,8 @@ def load_mcp_config() -> None:
     for config_path in mcp_config_paths:
         if config_path.exists():
             try:
-                with open(config_path) as f:
-                    config = json.load(f)
+                with open(config_path, "rb") as f:
+                    config = orjson.loads(f.read())
                     servers = config.get("mcpServers", {})
                     youtrack = servers.get("youtrack", {})
                     env = youtrack.get("env", {})
@@ -57,31 +62,15 @@ def load_mcp_config() -> None:
                 print(f"Warning: Could not load {config_path}: {e}")
 
 
-from mcp_youtrack.server import (
-    add_comment,
-    add_issue_link,
-    create_issue,
-    delete_comment,
-    delete_issue,
-    get_issue,
-    get_project_fields,
-    list_comments,
-    list_issue_links,
-    list_link_types,
-    list_projects,
-    mcp,
-    remove_issue_link,
-    search_issues,
-    update_issue,
-)
-from mcp_youtrack.client import YouTrackClient
-from mcp_youtrack.config import load_config
-
-
 class ToolVerifier:
     """Runs verification tests on MCP tools."""
 
     def __init__(self, test_project: str) -> None:
+        # Imported lazily so --help and config errors don't pay for loading
+        # the MCP framework
+        from mcp_youtrack import server
+
+        self.server = server
         self.test_project = test_project
         self.created_issues: list[str] = []
         self.results: dict[str, dict] = {}
@@ -95,8 +84,8 @@ class ToolVerifier:
     async def verify_list_projects(self) -> None:
         """Test list_projects tool."""
         try:
-            result = await list_projects()
-            data = json.loads(result)
+            result = await self.server.list_projects()
+            data = orjson.loads(result)
             if "error" in data:
                 self.record("list_projects", False, data["error"])
             elif data.get("count", 0) > 0:
@@ -109,8 +98,8 @@ class ToolVerifier:
     async def verify_get_project_fields(self) -> None:
         """Test get_project_fields tool."""
         try:
-            result = await get_project_fields(self.test_project)
-            data = json.loads(result)
+            result = await self.server.get_project_fields(self.test_project)
+            data = orjson.loads(result)
             if "error" in data:
                 self.record("get_project_fields", False, data["error"])
             elif "fields" in data:
@@ -124,16 +113,16 @@ class ToolVerifier:
         """Test search_issues tool with various filters."""
         try:
             # Basic search
-            result = await search_issues(project=self.test_project, limit=5)
-            data = json.loads(result)
+            result = await self.server.search_issues(project=self.test_project, limit=5)
+            data = orjson.loads(result)
             if "error" in data:
                 self.record("search_issues", False, data["error"])
             else:
                 self.record("search_issues", True, f"Found {data['count']} issues")
 
             # Search with state filter
-            result = await search_issues(project=self.test_project, state="Open", limit=3)
-            data = json.loads(result)
+            result = await self.server.search_issues(project=self.test_project, state="Open", limit=3)
+            data = orjson.loads(result)
             if "error" not in data:
                 self.record("search_issues (state)", True, "State filter works")
             else:
@@ -145,12 +134,12 @@ class ToolVerifier:
     async def verify_create_issue(self) -> str | None:
         """Test create_issue tool. Returns created issue ID."""
         try:
-            result = await create_issue(
+            result = await self.server.create_issue(
                 project=self.test_project,
                 summary="[TEST] MCP Tool Verification - Delete Me",
                 description="This is a test issue created by verify_tools.py. Safe to delete.",
             )
-            data = json.loads(result)
+            data = orjson.loads(result)
             if "error" in data:
                 self.record("create_issue", False, data["error"])
                 return None
@@ -169,8 +158,8 @@ class ToolVerifier:
     async def verify_get_issue(self, issue_id: str) -> None:
         """Test get_issue tool."""
         try:
-            result = await get_issue(issue_id)
-            data = json.loads(result)
+            result = await self.server.get_issue(issue_id)
+            data = orjson.loads(result)
             if "error" in data:
                 self.record("get_issue", False, data["error"])
             elif data.get("id") == issue_id:
@@ -180,14 +169,28 @@ class ToolVerifier:
         except Exception as e:
             self.record("get_issue", False, str(e))
 
+    async def verify_get_issue_full(self, issue_id: str) -> None:
+        """Test get_issue_full tool."""
+        try:
+            result = await self.server.get_issue_full(issue_id)
+            data = orjson.loads(result)
+            if "error" in data:
+                self.record("get_issue_full", False, data["error"])
+            elif data.get("id") == issue_id and "comments" in data and "links" in data:
+                self.record("get_issue_full", True, f"Retrieved {issue_id} with comments and links")
+            else:
+                self.record("get_issue_full", False, "Unexpected response shape")
+        except Exception as e:
+            self.record("get_issue_full", False, str(e))
+
     async def verify_update_issue(self, issue_id: str) -> None:
         """Test update_issue tool."""
         try:
-            result = await update_issue(
+            result = await self.server.update_issue(
                 issue_id=issue_id,
                 summary="[TEST] MCP Tool Verification - Updated",
             )
-            data = json.loads(result)
+            data = orjson.loads(result)
             if "error" in data:
                 self.record("update_issue", False, data["error"])
             elif data.get("_updated"):
@@ -200,11 +203,11 @@ class ToolVerifier:
     async def verify_add_comment(self, issue_id: str) -> None:
         """Test add_comment tool."""
         try:
-            result = await add_comment(
+            result = await self.server.add_comment(
                 issue_id=issue_id,
                 text="Test comment from verify_tools.py",
             )
-            data = json.loads(result)
+            data = orjson.loads(result)
             if "error" in data:
                 self.record("add_comment", False, data["error"])
             elif data.get("_created"):
@@ -217,8 +220,8 @@ class ToolVerifier:
     async def verify_list_comments(self, issue_id: str) -> str | None:
         """Test list_comments tool. Returns comment ID if found."""
         try:
-            result = await list_comments(issue_id)
-            data = json.loads(result)
+            result = await self.server.list_comments(issue_id)
+            data = orjson.loads(result)
             if "error" in data:
                 self.record("list_comments", False, data["error"])
                 return None
@@ -238,8 +241,8 @@ class ToolVerifier:
     async def verify_delete_comment(self, issue_id: str, comment_id: str) -> None:
         """Test delete_comment tool."""
         try:
-            result = await delete_comment(issue_id, comment_id)
-            data = json.loads(result)
+            result = await self.server.delete_comment(issue_id, comment_id)
+            data = orjson.loads(result)
             if "error" in data:
                 self.record("delete_comment", False, data["error"])
             elif data.get("deleted"):
@@ -249,11 +252,18 @@ class ToolVerifier:
         except Exception as e:
             self.record("delete_comment", False, str(e))
 
+    async def verify_comments(self, issue_id: str) -> None:
+        """Test add_comment, list_comments, delete_comment tools in order."""
+        await self.verify_add_comment(issue_id)
+        comment_id = await self.verify_list_comments(issue_id)
+        if comment_id:
+            await self.verify_delete_comment(issue_id, comment_id)
+
     async def verify_list_link_types(self) -> None:
         """Test list_link_types tool."""
         try:
-            result = await list_link_types()
-            data = json.loads(result)
+            result = await self.server.list_link_types()
+            data = orjson.loads(result)
             if "error" in data:
                 self.record("list_link_types", False, data["error"])
             elif data.get("count", 0) > 0:
@@ -267,8 +277,8 @@ class ToolVerifier:
         """Test add_issue_link, list_issue_links, remove_issue_link tools."""
         # Add link
         try:
-            result = await add_issue_link(issue_id1, issue_id2, "Relate")
-            data = json.loads(result)
+            result = await self.server.add_issue_link(issue_id1, issue_id2, "Relate")
+            data = orjson.loads(result)
             if "error" in data:
                 self.record("add_issue_link", False, data["error"])
             elif data.get("success"):
@@ -280,8 +290,8 @@ class ToolVerifier:
 
         # List links
         try:
-            result = await list_issue_links(issue_id1)
-            data = json.loads(result)
+            result = await self.server.list_issue_links(issue_id1)
+            data = orjson.loads(result)
             if "error" in data:
                 self.record("list_issue_links", False, data["error"])
             elif "links" in data:
@@ -293,8 +303,8 @@ class ToolVerifier:
 
         # Remove link
         try:
-            result = await remove_issue_link(issue_id1, issue_id2, "Relate")
-            data = json.loads(result)
+            result = await self.server.remove_issue_link(issue_id1, issue_id2, "Relate")
+            data = orjson.loads(result)
             if "error" in data:
                 self.record("remove_issue_link", False, data["error"])
             elif data.get("success"):
@@ -307,8 +317,8 @@ class ToolVerifier:
     async def verify_delete_issue(self, issue_id: str) -> None:
         """Test delete_issue tool."""
         try:
-            result = await delete_issue(issue_id)
-            data = json.loads(result)
+            result = await self.server.delete_issue(issue_id)
+            data = orjson.loads(result)
             if "error" in data:
                 self.record("delete_issue", False, data["error"])
             elif data.get("deleted"):
@@ -322,12 +332,15 @@ class ToolVerifier:
 
     async def cleanup(self, client: YouTrackClient) -> None:
         """Clean up any remaining test issues."""
-        for issue_id in self.created_issues:
-            try:
-                await client.delete_issue(issue_id)
+        results = await asyncio.gather(
+            *(client.delete_issue(issue_id) for issue_id in self.created_issues),
+            return_exceptions=True,
+        )
+        for issue_id, result in zip(self.created_issues, results, strict=True):
+            if isinstance(result, BaseException):
+                print(f"  Failed to clean up {issue_id}: {result}")
+            else:
                 print(f"  Cleaned up {issue_id}")
-            except Exception as e:
-                print(f"  Failed to clean up {issue_id}: {e}")
 
     async def run_all(self) -> bool:
         """Run all verification tests."""
@@ -335,48 +348,45 @@ class ToolVerifier:
         print("MCP YouTrack Tool Verification")
         print("=" * 60)
 
-        config = load_config()
-        print(f"\nConnecting to: {config.url}")
-        print(f"Test project: {self.test_project}\n")
-
-        async with YouTrackClient(config) as client:
-            # Inject client into MCP context manually for testing
-            # We need to mock the context since we're not running through MCP
-            from unittest.mock import MagicMock, patch
-
-            mock_ctx = MagicMock()
-            mock_ctx.request_context.lifespan_context = {"client": client, "config": config}
-
-            with patch.object(mcp, 'get_context', return_value=mock_ctx):
-                print("Testing read-only tools...")
-                await self.verify_list_projects()
-                await self.verify_get_project_fields()
-                await self.verify_search_issues()
-                await self.verify_list_link_types()
-
-                print("\nTesting write tools...")
-                issue1 = await self.verify_create_issue()
-                issue2 = await self.verify_create_issue()
-
-                if issue1:
-                    await self.verify_get_issue(issue1)
-                    await self.verify_update_issue(issue1)
-                    await self.verify_add_comment(issue1)
-                    comment_id = await self.verify_list_comments(issue1)
-                    if comment_id:
-                        await self.verify_delete_comment(issue1, comment_id)
-
-                if issue1 and issue2:
-                    await self.verify_issue_links(issue1, issue2)
-
-                print("\nTesting delete...")
-                if issue1:
-                    await self.verify_delete_issue(issue1)
-                if issue2:
-                    await self.verify_delete_issue(issue2)
-
-                print("\nCleaning up...")
-                await self.cleanup(client)
+        # The server lifespan loads config and exposes the shared client to the tools
+        async with self.server.lifespan(self.server.mcp) as context:
+            client = context["client"]
+            print(f"\nConnecting to: {context['config'].url}")
+            print(f"Test project: {self.test_project}\n")
+
+            print("Testing read-only tools...")
+            await asyncio.gather(
+                self.verify_list_projects(),
+                self.verify_get_project_fields(),
+                self.verify_search_issues(),
+                self.verify_list_link_types(),
+            )
+
+            print("\nTesting write tools...")
+            issue1, issue2 = await asyncio.gather(
+                self.verify_create_issue(),
+                self.verify_create_issue(),
+            )
+
+            if issue1:
+                await asyncio.gather(
+                    self.verify_get_issue(issue1),
+                    self.verify_get_issue_full(issue1),
+                    self.verify_update_issue(issue1),
+                    self.verify_comments(issue1),
+                )
+
+            if issue1 and issue2:
+                await self.verify_issue_links(issue1, issue2)
+
+            print("\nTesting delete...")
+            if issue1:
+                await self.verify_delete_issue(issue1)
+            if issue2:
+                await self.verify_delete_issue(issue2)
+
+            print("\nCleaning up...")
+            await self.cleanup(client)
 
         # Summary
         print("\n" + "=" * 60)
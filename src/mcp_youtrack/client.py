@@ -2,16 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+import time
+from collections.abc import AsyncIterator, Callable, Coroutine, Mapping
+from functools import wraps
+from types import MappingProxyType
+from typing import Any, Concatenate, ParamSpec
 
 import httpx
+import orjson
+from pydantic import TypeAdapter
 
 from .config import YouTrackConfig
-from .models import Comment, Issue, IssueCreate, IssueLink, IssueLinkType, IssueUpdate, Project
+from .models import (
+    Comment,
+    Issue,
+    IssueLink,
+    IssueLinkType,
+    Project,
+    issue_create_payload,
+    issue_update_payload,
+)
 
 logger = logging.getLogger(__name__)
 
+P = ParamSpec("P")
+
 
 class YouTrackError(Exception):
     """Base exception for YouTrack API errors."""
@@ -52,26 +69,98 @@ PROJECT_CUSTOM_FIELDS = (
 
 COMMENT_FIELDS = "id,text,author(id,login,name),created,updated"
 
+LINK_TYPE_FIELDS = "id,name,sourceToTarget,targetToSource,directed,aggregation"
+
+ISSUE_LINK_FIELDS = (
+    "id,direction,linkType(id,name,sourceToTarget,targetToSource,directed),"
+    "issues(id,idReadable,summary)"
+)
+
+# Shared query params for requests that only select fields; read-only since every call shares them
+ISSUE_PARAMS = MappingProxyType({"fields": ISSUE_FIELDS})
+PROJECT_PARAMS = MappingProxyType({"fields": PROJECT_FIELDS})
+PROJECT_CUSTOM_FIELDS_PARAMS = MappingProxyType({"fields": PROJECT_CUSTOM_FIELDS})
+COMMENT_PARAMS = MappingProxyType({"fields": COMMENT_FIELDS})
+LINK_TYPE_PARAMS = MappingProxyType({"fields": LINK_TYPE_FIELDS})
+ISSUE_LINK_PARAMS = MappingProxyType({"fields": ISSUE_LINK_FIELDS})
+
+# Validators for list responses, decoding the raw JSON body in a single pass
+ISSUE_LIST_ADAPTER = TypeAdapter(list[Issue])
+PROJECT_LIST_ADAPTER = TypeAdapter(list[Project])
+COMMENT_LIST_ADAPTER = TypeAdapter(list[Comment])
+LINK_TYPE_LIST_ADAPTER = TypeAdapter(list[IssueLinkType])
+ISSUE_LINK_LIST_ADAPTER = TypeAdapter(list[IssueLink])
+
+# Link types are instance-wide configuration; refresh cached lookups after this many seconds
+LINK_TYPES_CACHE_TTL = 600.0
+
+# Project metadata changes rarely; cache project lookups for this many seconds
+PROJECT_CACHE_TTL = 300.0
+
+
+def _checked(
+    fn: Callable[Concatenate[YouTrackClient, P], Coroutine[Any, Any, httpx.Response]],
+) -> Callable[Concatenate[YouTrackClient, P], Coroutine[Any, Any, httpx.Response]]:
+    """Wrap a request method with the concurrency limit and error handling.
+
+    At most config.max_concurrency requests are in flight per client; unsuccessful
+    responses raise the matching YouTrackError.
+    """
+
+    @wraps(fn)
+    async def wrapper(
+        self: YouTrackClient, /, *args: P.args, **kwargs: P.kwargs
+    ) -> httpx.Response:
+        async with self._request_slots:
+            response = await fn(self, *args, **kwargs)
+        if not response.is_success:
+            self._handle_error(response)
+        return response
+
+    return wrapper
+
 
 class YouTrackClient:
     """Async client for YouTrack REST API."""
 
-    def __init__(self, config: YouTrackConfig) -> None:
-        """Initialize the client with configuration."""
+    def __init__(
+        self, config: YouTrackConfig, transport: httpx.AsyncBaseTransport | None = None
+    ) -> None:
+        """Initialize the client with configuration.
+
+        Args:
+            config: YouTrack connection settings.
+            transport: Optional transport to send requests through instead of
+                the default pooled HTTP/2 one (e.g. httpx.MockTransport). An injected
+                transport bypasses proxy environment variables.
+        """
         self.config = config
+        self._transport = transport
         self._client: httpx.AsyncClient | None = None
+        # Bounds concurrent requests so bursts of tool calls don't trip rate limits
+        self._request_slots = asyncio.Semaphore(config.max_concurrency)
+        self._issue_requests: dict[str, asyncio.Future[Issue]] = {}
+        self._link_types_cache: dict[str, IssueLinkType] | None = None
+        self._link_types_fetched_at: float = 0.0
+        # (kind, *args) -> (fetched_at, value); per instance, so keyed to config.url
+        self._project_cache: dict[tuple[Any, ...], tuple[float, Any]] = {}
 
     async def __aenter__(self) -> YouTrackClient:
         """Enter async context."""
+        # Pool settings go on the client rather than a prebuilt transport, so
+        # httpx still honors HTTP(S)_PROXY/ALL_PROXY/NO_PROXY from the environment
         self._client = httpx.AsyncClient(
             base_url=self.config.api_url,
-            headers={
-                **self.config.auth_header,
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-            },
+            headers=self.config.default_headers,
             timeout=self.config.timeout,
             verify=self.config.verify_ssl,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+                keepalive_expiry=60,
+            ),
+            transport=self._transport,
         )
         return self
 
@@ -80,6 +169,8 @@ class YouTrackClient:
         if self._client:
             await self._client.aclose()
             self._client = None
+        self._link_types_cache = None
+        self.invalidate_projects()
 
     @property
     def client(self) -> httpx.AsyncClient:
@@ -90,14 +181,61 @@ class YouTrackClient:
             )
         return self._client
 
+    @_checked
+    async def _get(self, url: str, *, params: Mapping[str, Any] | None = None) -> httpx.Response:
+        """Send a GET request."""
+        return await self.client.get(url, params=params)
+
+    @_checked
+    async def _post_json(
+        self,
+        url: str,
+        payload: Any,
+        *,
+        params: Mapping[str, str] | None = None,
+    ) -> httpx.Response:
+        """POST a JSON body serialized with orjson.
+
+        The Content-Type header is already set on the client by default.
+        """
+        return await self.client.post(url, content=orjson.dumps(payload), params=params)
+
+    @_checked
+    async def _delete(self, url: str) -> httpx.Response:
+        """Send a DELETE request."""
+        return await self.client.delete(url)
+
+    def _cached_project_data(self, key: tuple[Any, ...]) -> Any | None:
+        """Return a cached project lookup, or None if missing or expired."""
+        entry = self._project_cache.get(key)
+        if entry is None:
+            return None
+        fetched_at, value = entry
+        if time.monotonic() - fetched_at > PROJECT_CACHE_TTL:
+            del self._project_cache[key]
+            return None
+        return value
+
+    def _cache_project_data(self, key: tuple[Any, ...], value: Any) -> None:
+        """Store a project lookup result in the cache."""
+        self._project_cache[key] = (time.monotonic(), value)
+
+    def invalidate_projects(self) -> None:
+        """Drop cached project, project list and project custom field lookups."""
+        self._project_cache.clear()
+
     def _handle_error(self, response: httpx.Response) -> None:
         """Handle HTTP error responses."""
         status = response.status_code
 
         try:
-            error_data = response.json()
+            error_data = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            error_data = None
+
+        if isinstance(error_data, dict):
             message = error_data.get("error_description") or error_data.get("error", str(status))
-        except Exception:
+        else:
             message = response.text or f"HTTP {status}"
 
         if status == 401:
@@ -140,13 +278,12 @@ class YouTrackClient:
             List of matching issues.
         """
         # Build query string
-        query_parts: list[str] = []
-        if project:
-            query_parts.append(f"project: {project}")
-        if query:
-            query_parts.append(query)
-
-        full_query = " ".join(query_parts) if query_parts else None
+        if project and query:
+            full_query: str | None = f"project: {project} {query}"
+        elif project:
+            full_query = f"project: {project}"
+        else:
+            full_query = query or None
 
         params: dict[str, Any] = {
             "fields": ISSUE_FIELDS,
@@ -157,19 +294,50 @@ class YouTrackClient:
             params["query"] = full_query
 
         logger.debug("Listing issues with params: %s", params)
-        response = await self.client.get("/issues", params=params)
+        response = await self._get("/issues", params=params)
 
-        if not response.is_success:
-            self._handle_error(response)
+        return ISSUE_LIST_ADAPTER.validate_json(response.content)
+
+    async def iter_issues(
+        self,
+        project: str | None = None,
+        query: str | None = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[Issue]:
+        """Iterate over all matching issues, fetching one page at a time.
+
+        Args:
+            project: Project short name to filter by.
+            query: YouTrack search query.
+            page_size: Number of issues requested per page (default 100).
 
-        data = response.json()
-        return [Issue.model_validate(item) for item in data]
+        Yields:
+            Matching issues, as soon as each page is decoded.
 
-    async def get_issue(self, issue_id: str) -> Issue:
+        Raises:
+            ValueError: If page_size is less than 1.
+        """
+        if page_size < 1:
+            raise ValueError(f"page_size must be at least 1, got {page_size}")
+        skip = 0
+        while True:
+            page = await self.list_issues(project=project, query=query, limit=page_size, skip=skip)
+            for issue in page:
+                yield issue
+            if len(page) < page_size:
+                return
+            skip += page_size
+
+    async def get_issue(self, issue_id: str, *, fresh: bool = False) -> Issue:
         """Get a single issue by ID.
 
+        Concurrent calls for the same issue share a single request.
+
         Args:
             issue_id: Issue ID (readable like 'PROJECT-123' or database ID).
+            fresh: Always send a new request instead of joining one already in
+                flight, e.g. to read back an issue right after writing it. Later
+                calls join this request rather than the older one.
 
         Returns:
             The issue details.
@@ -177,16 +345,30 @@ class YouTrackClient:
         Raises:
             YouTrackNotFoundError: If the issue doesn't exist.
         """
+        pending = None if fresh else self._issue_requests.get(issue_id)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch_issue(issue_id))
+            self._issue_requests[issue_id] = pending
+            pending.add_done_callback(
+                lambda done: self._forget_issue_request(issue_id, done)
+            )
+        # Shielded so one cancelled caller doesn't cancel the fetch for the others
+        return await asyncio.shield(pending)
+
+    def _forget_issue_request(self, issue_id: str, done: asyncio.Future[Issue]) -> None:
+        """Drop a finished request unless a fresh one has replaced it."""
+        if self._issue_requests.get(issue_id) is done:
+            del self._issue_requests[issue_id]
+
+    async def _fetch_issue(self, issue_id: str) -> Issue:
+        """Fetch and decode a single issue."""
         logger.debug("Getting issue: %s", issue_id)
-        response = await self.client.get(
+        response = await self._get(
             f"/issues/{issue_id}",
-            params={"fields": ISSUE_FIELDS},
+            params=ISSUE_PARAMS,
         )
 
-        if not response.is_success:
-            self._handle_error(response)
-
-        return Issue.model_validate(response.json())
+        return Issue.model_validate_json(response.content)
 
     async def create_issue(
         self,
@@ -204,23 +386,21 @@ class YouTrackClient:
         Returns:
             The created issue.
         """
-        create_data = IssueCreate(
-            project=project_id,
-            summary=summary,
-            description=description,
-        )
+        payload = issue_create_payload(project_id, summary, description)
 
         logger.debug("Creating issue in project %s: %s", project_id, summary)
-        response = await self.client.post(
-            "/issues",
-            json=create_data.to_api_payload(),
-            params={"fields": ISSUE_FIELDS},
-        )
-
-        if not response.is_success:
-            self._handle_error(response)
+        try:
+            response = await self._post_json(
+                "/issues",
+                payload,
+                params=ISSUE_PARAMS,
+            )
+        except YouTrackNotFoundError:
+            # The project may have been removed since it was cached
+            self.invalidate_projects()
+            raise
 
-        return Issue.model_validate(response.json())
+        return Issue.model_validate_json(response.content)
 
     async def update_issue(
         self,
@@ -238,27 +418,19 @@ class YouTrackClient:
         Returns:
             The updated issue.
         """
-        update_data = IssueUpdate(
-            summary=summary,
-            description=description,
-        )
-
-        payload = update_data.to_api_payload()
+        payload = issue_update_payload(summary, description)
         if not payload:
             # No changes requested, just return the current issue
             return await self.get_issue(issue_id)
 
         logger.debug("Updating issue %s with: %s", issue_id, payload)
-        response = await self.client.post(
+        response = await self._post_json(
             f"/issues/{issue_id}",
-            json=payload,
-            params={"fields": ISSUE_FIELDS},
+            payload,
+            params=ISSUE_PARAMS,
         )
 
-        if not response.is_success:
-            self._handle_error(response)
-
-        return Issue.model_validate(response.json())
+        return Issue.model_validate_json(response.content)
 
     async def delete_issue(self, issue_id: str) -> bool:
         """Delete an issue.
@@ -273,25 +445,30 @@ class YouTrackClient:
             YouTrackNotFoundError: If the issue doesn't exist.
         """
         logger.debug("Deleting issue: %s", issue_id)
-        response = await self.client.delete(f"/issues/{issue_id}")
-
-        if not response.is_success:
-            self._handle_error(response)
+        await self._delete(f"/issues/{issue_id}")
 
         return True
 
-    async def list_projects(self, limit: int = 100, skip: int = 0) -> list[Project]:
+    async def list_projects(
+        self, limit: int = 100, skip: int = 0, *, fresh: bool = False
+    ) -> list[Project]:
         """List all accessible projects.
 
         Args:
             limit: Maximum number of projects to return.
             skip: Number of projects to skip for pagination.
+            fresh: Skip the cache lookup; the result still refreshes the cache.
 
         Returns:
-            List of projects.
+            List of projects. Results are cached for PROJECT_CACHE_TTL seconds.
         """
+        key = ("list", limit, skip)
+        cached = None if fresh else self._cached_project_data(key)
+        if cached is not None:
+            return list(cached)
+
         logger.debug("Listing projects")
-        response = await self.client.get(
+        response = await self._get(
             "/admin/projects",
             params={
                 "fields": PROJECT_FIELDS,
@@ -300,11 +477,37 @@ class YouTrackClient:
             },
         )
 
-        if not response.is_success:
-            self._handle_error(response)
+        projects = PROJECT_LIST_ADAPTER.validate_json(response.content)
+        self._cache_project_data(key, projects)
+        # Same field selection as get_project, so seed its cache by ID and short name
+        for project in projects:
+            self._cache_project_data(("project", project.id), project)
+            if project.short_name:
+                self._cache_project_data(("project", project.short_name), project)
+        return list(projects)
+
+    async def iter_projects(self, page_size: int = 100) -> AsyncIterator[Project]:
+        """Iterate over all accessible projects, fetching one page at a time.
+
+        Args:
+            page_size: Number of projects requested per page (default 100).
 
-        data = response.json()
-        return [Project.model_validate(item) for item in data]
+        Yields:
+            Projects, as soon as each page is decoded.
+
+        Raises:
+            ValueError: If page_size is less than 1.
+        """
+        if page_size < 1:
+            raise ValueError(f"page_size must be at least 1, got {page_size}")
+        skip = 0
+        while True:
+            page = await self.list_projects(limit=page_size, skip=skip)
+            for project in page:
+                yield project
+            if len(page) < page_size:
+                return
+            skip += page_size
 
     async def get_project(self, project_id: str) -> Project:
         """Get a project by ID or short name.
@@ -313,39 +516,50 @@ class YouTrackClient:
             project_id: Project ID or short name.
 
         Returns:
-            The project details.
+            The project details. Results are cached for PROJECT_CACHE_TTL seconds.
         """
+        key = ("project", project_id)
+        cached: Project | None = self._cached_project_data(key)
+        if cached is not None:
+            return cached
+
         logger.debug("Getting project: %s", project_id)
-        response = await self.client.get(
+        response = await self._get(
             f"/admin/projects/{project_id}",
-            params={"fields": PROJECT_FIELDS},
+            params=PROJECT_PARAMS,
         )
 
-        if not response.is_success:
-            self._handle_error(response)
+        project = Project.model_validate_json(response.content)
+        self._cache_project_data(key, project)
+        return project
 
-        return Project.model_validate(response.json())
-
-    async def get_project_custom_fields(self, project_id: str) -> list[dict[str, Any]]:
+    async def get_project_custom_fields(
+        self, project_id: str, *, fresh: bool = False
+    ) -> list[dict[str, Any]]:
         """Get custom fields configured for a project.
 
         Args:
             project_id: Project ID or short name.
+            fresh: Skip the cache lookup; the result still refreshes the cache.
 
         Returns:
-            List of custom field definitions with possible values.
+            List of custom field definitions with possible values. Results are
+            cached for PROJECT_CACHE_TTL seconds and must not be mutated.
         """
+        key = ("custom_fields", project_id)
+        cached = None if fresh else self._cached_project_data(key)
+        if cached is not None:
+            return list(cached)
+
         logger.debug("Getting custom fields for project: %s", project_id)
-        response = await self.client.get(
+        response = await self._get(
             f"/admin/projects/{project_id}/customFields",
-            params={"fields": PROJECT_CUSTOM_FIELDS},
+            params=PROJECT_CUSTOM_FIELDS_PARAMS,
         )
 
-        if not response.is_success:
-            self._handle_error(response)
-
-        result: list[dict[str, Any]] = response.json()
-        return result
+        result: list[dict[str, Any]] = orjson.loads(response.content)
+        self._cache_project_data(key, result)
+        return list(result)
 
     async def execute_command(
         self,
@@ -371,10 +585,7 @@ class YouTrackClient:
             payload["comment"] = comment
 
         logger.debug("Executing command on %s: %s", issue_id, command)
-        response = await self.client.post("/commands", json=payload)
-
-        if not response.is_success:
-            self._handle_error(response)
+        await self._post_json("/commands", payload)
 
     async def add_comment(self, issue_id: str, text: str) -> Comment:
         """Add a comment to an issue.
@@ -387,16 +598,13 @@ class YouTrackClient:
             The created comment.
         """
         logger.debug("Adding comment to %s", issue_id)
-        response = await self.client.post(
+        response = await self._post_json(
             f"/issues/{issue_id}/comments",
-            json={"text": text},
-            params={"fields": COMMENT_FIELDS},
+            {"text": text},
+            params=COMMENT_PARAMS,
         )
 
-        if not response.is_success:
-            self._handle_error(response)
-
-        return Comment.model_validate(response.json())
+        return Comment.model_validate_json(response.content)
 
     async def list_comments(self, issue_id: str) -> list[Comment]:
         """Get all comments on an issue.
@@ -408,16 +616,12 @@ class YouTrackClient:
             List of comments.
         """
         logger.debug("Listing comments for %s", issue_id)
-        response = await self.client.get(
+        response = await self._get(
             f"/issues/{issue_id}/comments",
-            params={"fields": COMMENT_FIELDS},
+            params=COMMENT_PARAMS,
         )
 
-        if not response.is_success:
-            self._handle_error(response)
-
-        data = response.json()
-        return [Comment.model_validate(item) for item in data]
+        return COMMENT_LIST_ADAPTER.validate_json(response.content)
 
     async def delete_comment(self, issue_id: str, comment_id: str) -> bool:
         """Delete a comment from an issue.
@@ -433,10 +637,7 @@ class YouTrackClient:
             YouTrackNotFoundError: If the issue or comment doesn't exist.
         """
         logger.debug("Deleting comment %s from issue %s", comment_id, issue_id)
-        response = await self.client.delete(f"/issues/{issue_id}/comments/{comment_id}")
-
-        if not response.is_success:
-            self._handle_error(response)
+        await self._delete(f"/issues/{issue_id}/comments/{comment_id}")
 
         return True
 
@@ -447,16 +648,53 @@ class YouTrackClient:
             List of link types with their directional names.
         """
         logger.debug("Listing issue link types")
-        response = await self.client.get(
+        response = await self._get(
             "/issueLinkTypes",
-            params={"fields": "id,name,sourceToTarget,targetToSource,directed,aggregation"},
+            params=LINK_TYPE_PARAMS,
         )
 
-        if not response.is_success:
-            self._handle_error(response)
+        return LINK_TYPE_LIST_ADAPTER.validate_json(response.content)
 
-        data = response.json()
-        return [IssueLinkType.model_validate(item) for item in data]
+    async def _refresh_link_types(self) -> dict[str, IssueLinkType]:
+        """Fetch link types and rebuild the lowercase name index."""
+        index: dict[str, IssueLinkType] = {}
+        for lt in await self.list_link_types():
+            if lt.name:
+                # Keep the first type for names differing only in case, as next() did
+                index.setdefault(lt.name.lower(), lt)
+        self._link_types_cache = index
+        self._link_types_fetched_at = time.monotonic()
+        return index
+
+    async def _get_link_type(self, link_type: str) -> IssueLinkType:
+        """Look up a link type by name (case-insensitive), using the cache.
+
+        Link types are fetched once and cached for LINK_TYPES_CACHE_TTL seconds.
+        A name missing from a cached listing triggers one refetch, in case the
+        type was added since.
+
+        Raises:
+            YouTrackError: If no link type has the given name.
+        """
+        link_types = self._link_types_cache
+        refreshed = False
+        if (
+            link_types is None
+            or time.monotonic() - self._link_types_fetched_at > LINK_TYPES_CACHE_TTL
+        ):
+            link_types = await self._refresh_link_types()
+            refreshed = True
+
+        link_type_obj = link_types.get(link_type.lower())
+        if link_type_obj is None and not refreshed:
+            link_types = await self._refresh_link_types()
+            link_type_obj = link_types.get(link_type.lower())
+        if link_type_obj is None:
+            available = [lt.name for lt in link_types.values() if lt.name]
+            raise YouTrackError(
+                f"Unknown link type '{link_type}'. Available types: {', '.join(available)}"
+            )
+        return link_type_obj
 
     async def list_issue_links(self, issue_id: str) -> list[IssueLink]:
         """Get all links for an issue.
@@ -468,19 +706,36 @@ class YouTrackClient:
             List of issue links with linked issues.
         """
         logger.debug("Listing links for issue %s", issue_id)
-        response = await self.client.get(
+        response = await self._get(
             f"/issues/{issue_id}/links",
-            params={
-                "fields": "id,direction,linkType(id,name,sourceToTarget,targetToSource,directed),"
-                          "issues(id,idReadable,summary)"
-            },
+            params=ISSUE_LINK_PARAMS,
         )
 
-        if not response.is_success:
-            self._handle_error(response)
+        return ISSUE_LINK_LIST_ADAPTER.validate_json(response.content)
 
-        data = response.json()
-        return [IssueLink.model_validate(item) for item in data]
+    async def get_issue_bundle(
+        self, issue_id: str
+    ) -> tuple[Issue, list[Comment], list[IssueLink]]:
+        """Get an issue together with its comments and links.
+
+        The three requests are independent, so they are issued concurrently
+        over the shared connection pool.
+
+        Args:
+            issue_id: Issue ID to fetch.
+
+        Returns:
+            Tuple of (issue, comments, links).
+
+        Raises:
+            YouTrackError: The first error raised by any of the requests.
+        """
+        logger.debug("Getting issue bundle: %s", issue_id)
+        return await asyncio.gather(
+            self.get_issue(issue_id),
+            self.list_comments(issue_id),
+            self.list_issue_links(issue_id),
+        )
 
     async def add_issue_link(
         self,
@@ -498,17 +753,7 @@ class YouTrackClient:
         Note:
             For 'Depend' type: issue_id "depends on" target_issue_id.
         """
-        # First, get the link type ID
-        link_types = await self.list_link_types()
-        link_type_obj = next(
-            (lt for lt in link_types if lt.name and lt.name.lower() == link_type.lower()),
-            None
-        )
-        if not link_type_obj:
-            available = [lt.name for lt in link_types if lt.name]
-            raise YouTrackError(
-                f"Unknown link type '{link_type}'. Available types: {', '.join(available)}"
-            )
+        link_type_obj = await self._get_link_type(link_type)
 
         # Use command API to add the link
         command = f"{link_type_obj.source_to_target} {target_issue_id}"
@@ -529,17 +774,7 @@ class YouTrackClient:
             target_issue_id: Target issue ID to unlink (e.g., 'PROJECT-456').
             link_type: Link type name (e.g., 'Depend', 'Duplicate', 'Relate', 'Subtask').
         """
-        # First, get the link type ID
-        link_types = await self.list_link_types()
-        link_type_obj = next(
-            (lt for lt in link_types if lt.name and lt.name.lower() == link_type.lower()),
-            None
-        )
-        if not link_type_obj:
-            available = [lt.name for lt in link_types if lt.name]
-            raise YouTrackError(
-                f"Unknown link type '{link_type}'. Available types: {', '.join(available)}"
-            )
+        link_type_obj = await self._get_link_type(link_type)
 
         # Use command API with "remove" prefix to remove the link
         command = f"remove {link_type_obj.source_to_target} {target_issue_id}"
@@ -4,30 +4,70 @@ from __future__ import annotations
 
 import os
 import sys
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
 
 from dotenv import load_dotenv
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class YouTrackConfig:
-    """Configuration for YouTrack API connection."""
+    """Configuration for YouTrack API connection.
+
+    Immutable; derived values (api_url, auth_header, default_headers) are
+    computed once at construction. The client keeps one pooled connection
+    set per config, sized by max_connections and max_keepalive_connections.
+    """
 
     url: str
     token: str
     default_project: str | None = None
     timeout: int = 30
     verify_ssl: bool = True
+    max_concurrency: int = 10
+    max_connections: int = 50
+    max_keepalive_connections: int = 20
+    json_indent: bool = False
+    api_url: str = field(init=False)
+    auth_header: Mapping[str, str] = field(init=False, repr=False)
+    default_headers: Mapping[str, str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the API base URL and request headers."""
+        object.__setattr__(self, "api_url", f"{self.url.rstrip('/')}/api")
+        object.__setattr__(
+            self,
+            "auth_header",
+            MappingProxyType({"Authorization": f"Bearer {self.token}"}),
+        )
+        object.__setattr__(
+            self,
+            "default_headers",
+            MappingProxyType(
+                {
+                    **self.auth_header,
+                    "Accept": "application/json",
+                    "Content-Type": "application/json",
+                }
+            ),
+        )
 
-    @property
-    def api_url(self) -> str:
-        """Get the API base URL."""
-        return f"{self.url.rstrip('/')}/api"
 
-    @property
-    def auth_header(self) -> dict[str, str]:
-        """Get the authorization header."""
-        return {"Authorization": f"Bearer {self.token}"}
+def _positive_int_env(name: str, default: int) -> int:
+    """Read a positive integer setting, warning and using default if invalid."""
+    value_str = os.getenv(name, str(default))
+    try:
+        value = int(value_str)
+        if value < 1:
+            raise ValueError(value_str)
+    except ValueError:
+        print(
+            f"Warning: Invalid {name} value '{value_str}', using default {default}",
+            file=sys.stderr,
+        )
+        return default
+    return value
 
 
 def load_config() -> YouTrackConfig:
@@ -70,14 +110,25 @@ def load_config() -> YouTrackConfig:
         )
         timeout = 30
 
+    max_concurrency = _positive_int_env("YOUTRACK_MAX_CONCURRENCY", 10)
+    max_connections = _positive_int_env("YOUTRACK_MAX_CONNECTIONS", 50)
+    max_keepalive_connections = _positive_int_env("YOUTRACK_MAX_KEEPALIVE_CONNECTIONS", 20)
+
     # SSL verification - default True, set to "false" to disable
     verify_ssl_str = os.getenv("YOUTRACK_VERIFY_SSL", "true").lower()
     verify_ssl = verify_ssl_str not in ("false", "0", "no")
 
+    # Tool responses are compact JSON unless indentation is requested
+    json_indent = os.getenv("YOUTRACK_JSON_INDENT", "false").lower() in ("true", "1", "yes")
+
     return YouTrackConfig(
         url=url,
         token=token,
         default_project=os.getenv("YOUTRACK_DEFAULT_PROJECT"),
         timeout=timeout,
         verify_ssl=verify_ssl,
+        max_concurrency=max_concurrency,
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        json_indent=json_indent,
     )
@@ -2,15 +2,32 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag, field_validator
+
+
+def parse_timestamp(v: Any) -> datetime | None:
+    """Parse a YouTrack Unix timestamp (milliseconds) to a UTC datetime."""
+    if isinstance(v, int):
+        return datetime.fromtimestamp(v / 1000, tz=timezone.utc)
+    if isinstance(v, datetime):
+        return v
+    return None
+
+
+# Shared model configs; high-volume response entities are also frozen
+MODEL_CONFIG = ConfigDict(populate_by_name=True, extra="ignore")
+FROZEN_MODEL_CONFIG = ConfigDict(populate_by_name=True, extra="ignore", frozen=True)
 
 
 class User(BaseModel):
     """YouTrack user entity."""
 
+    model_config = FROZEN_MODEL_CONFIG
+
     id: str
     login: str | None = None
     name: str | None = None
@@ -20,6 +37,8 @@ class User(BaseModel):
 class Project(BaseModel):
     """YouTrack project entity."""
 
+    model_config = FROZEN_MODEL_CONFIG
+
     id: str
     name: str | None = None
     short_name: str | None = Field(None, alias="shortName")
@@ -30,40 +49,58 @@ class Project(BaseModel):
 class CustomFieldValue(BaseModel):
     """Value of a custom field (can be various types)."""
 
+    model_config = FROZEN_MODEL_CONFIG
+
     id: str | None = None
     name: str | None = None
     login: str | None = None  # For user fields
     presentation: str | None = None  # Formatted display value
 
 
+def _custom_field_value_kind(v: Any) -> str:
+    """Pick the union member for a raw custom field value by its JSON shape."""
+    if isinstance(v, (dict, CustomFieldValue)):
+        return "object"
+    if isinstance(v, list):
+        return "list"
+    return "scalar"
+
+
+CustomFieldValueType = Annotated[
+    Annotated[CustomFieldValue, Tag("object")]
+    | Annotated[list[CustomFieldValue], Tag("list")]
+    | Annotated[str | int | float | None, Tag("scalar")],
+    Discriminator(_custom_field_value_kind),
+]
+
+
 class CustomField(BaseModel):
     """YouTrack custom field on an issue."""
 
+    model_config = FROZEN_MODEL_CONFIG
+
     id: str | None = None
     name: str | None = None
-    value: CustomFieldValue | list[CustomFieldValue] | str | int | float | None = None
+    value: CustomFieldValueType = None
 
     @field_validator("value", mode="before")
     @classmethod
-    def parse_value(
-        cls, v: Any
-    ) -> CustomFieldValue | list[CustomFieldValue] | str | int | float | None:
-        """Parse custom field value which can be various types."""
-        if v is None:
-            return None
-        if isinstance(v, (str, int, float)):
+    def parse_value(cls, v: Any) -> Any:
+        """Coerce non-JSON custom field values to a string.
+
+        JSON values are passed through untouched; the discriminator routes
+        them straight to the matching union member in pydantic-core.
+        """
+        if v is None or isinstance(v, (dict, list, str, int, float, CustomFieldValue)):
             return v
-        if isinstance(v, list):
-            return [CustomFieldValue.model_validate(item) for item in v]
-        if isinstance(v, dict):
-            return CustomFieldValue.model_validate(v)
-        # For any other type, try to convert to string
         return str(v)
 
 
 class ProjectCustomField(BaseModel):
     """Custom field definition for a project."""
 
+    model_config = MODEL_CONFIG
+
     id: str
     name: str | None = Field(None, alias="field")
     field_name: str | None = None
@@ -88,6 +125,8 @@ class ProjectCustomField(BaseModel):
 class Comment(BaseModel):
     """YouTrack comment entity."""
 
+    model_config = MODEL_CONFIG
+
     id: str
     text: str | None = None
     author: User | None = None
@@ -98,18 +137,14 @@ class Comment(BaseModel):
     @classmethod
     def parse_timestamp(cls, v: Any) -> datetime | None:
         """Parse Unix timestamp (milliseconds) to datetime."""
-        if v is None:
-            return None
-        if isinstance(v, int):
-            return datetime.fromtimestamp(v / 1000)
-        if isinstance(v, datetime):
-            return v
-        return None
+        return parse_timestamp(v)
 
 
 class Issue(BaseModel):
     """YouTrack issue entity."""
 
+    model_config = FROZEN_MODEL_CONFIG
+
     id: str
     id_readable: str | None = Field(None, alias="idReadable")
     summary: str | None = None
@@ -128,61 +163,86 @@ class Issue(BaseModel):
     @classmethod
     def parse_timestamp(cls, v: Any) -> datetime | None:
         """Parse Unix timestamp (milliseconds) to datetime."""
-        if v is None:
-            return None
-        if isinstance(v, int):
-            return datetime.fromtimestamp(v / 1000)
-        if isinstance(v, datetime):
-            return v
-        return None
+        return parse_timestamp(v)
+
+    @cached_property
+    def _custom_field_index(self) -> dict[str, CustomField]:
+        """Index of custom fields by name, built on first lookup.
+
+        Treat custom_fields as read-only after validation; the index is not
+        rebuilt if the list is replaced.
+        """
+        index: dict[str, CustomField] = {}
+        for field in self.custom_fields:
+            # Keep the first field for a duplicated name, as the linear scan did
+            if field.name and field.name not in index:
+                index[field.name] = field
+        return index
 
     def get_field_value(self, field_name: str) -> Any:
         """Get the value of a custom field by name."""
-        for field in self.custom_fields:
-            if field.name == field_name:
-                if isinstance(field.value, CustomFieldValue):
-                    return field.value.name or field.value.presentation
-                return field.value
-        return None
+        field = self._custom_field_index.get(field_name)
+        if field is None:
+            return None
+        if isinstance(field.value, CustomFieldValue):
+            return field.value.name or field.value.presentation
+        return field.value
+
+
+def issue_create_payload(
+    project_id: str, summary: str, description: str | None = None
+) -> dict[str, Any]:
+    """Build the YouTrack API payload for creating an issue."""
+    payload: dict[str, Any] = {"project": {"id": project_id}, "summary": summary}
+    if description:
+        payload["description"] = description
+    return payload
+
+
+def issue_update_payload(
+    summary: str | None = None, description: str | None = None
+) -> dict[str, Any]:
+    """Build the YouTrack API payload for updating an issue."""
+    payload: dict[str, Any] = {}
+    if summary is not None:
+        payload["summary"] = summary
+    if description is not None:
+        payload["description"] = description
+    return payload
 
 
 class IssueCreate(BaseModel):
     """Request model for creating an issue."""
 
+    model_config = MODEL_CONFIG
+
     project_id: str = Field(..., alias="project")
     summary: str
     description: str | None = None
 
     def to_api_payload(self) -> dict[str, Any]:
         """Convert to YouTrack API payload format."""
-        payload: dict[str, Any] = {
-            "project": {"id": self.project_id},
-            "summary": self.summary,
-        }
-        if self.description:
-            payload["description"] = self.description
-        return payload
+        return issue_create_payload(self.project_id, self.summary, self.description)
 
 
 class IssueUpdate(BaseModel):
     """Request model for updating an issue."""
 
+    model_config = MODEL_CONFIG
+
     summary: str | None = None
     description: str | None = None
 
     def to_api_payload(self) -> dict[str, Any]:
         """Convert to YouTrack API payload format."""
-        payload: dict[str, Any] = {}
-        if self.summary is not None:
-            payload["summary"] = self.summary
-        if self.description is not None:
-            payload["description"] = self.description
-        return payload
+        return issue_update_payload(self.summary, self.description)
 
 
 class IssueSearchResult(BaseModel):
     """Result of an issue search operation."""
 
+    model_config = MODEL_CONFIG
+
     issues: list[Issue]
     total: int | None = None
     query: str | None = None
@@ -191,6 +251,8 @@ class IssueSearchResult(BaseModel):
 class ProjectListResult(BaseModel):
     """Result of a project list operation."""
 
+    model_config = MODEL_CONFIG
+
     projects: list[Project]
     total: int
 
@@ -198,6 +260,8 @@ class ProjectListResult(BaseModel):
 class IssueLinkType(BaseModel):
     """YouTrack issue link type."""
 
+    model_config = MODEL_CONFIG
+
     id: str | None = None
     name: str | None = None
     source_to_target: str | None = Field(None, alias="sourceToTarget")
@@ -209,6 +273,8 @@ class IssueLinkType(BaseModel):
 class IssueLinkDirection(BaseModel):
     """Direction info for an issue link."""
 
+    model_config = MODEL_CONFIG
+
     id: str | None = None
     name: str | None = None
 
@@ -216,6 +282,8 @@ class IssueLinkDirection(BaseModel):
 class IssueLink(BaseModel):
     """YouTrack issue link entity."""
 
+    model_config = MODEL_CONFIG
+
     id: str
     direction: str | None = None  # "OUTWARD", "INWARD", or "BOTH"
     link_type: IssueLinkType | None = Field(None, alias="linkType")
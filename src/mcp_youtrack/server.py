@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import sys
-from collections.abc import AsyncIterator
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
-from typing import Any
+from contextvars import ContextVar
+from datetime import datetime
+from operator import attrgetter
+from typing import Any, TypeVar
 
+import orjson
 from mcp.server.fastmcp import FastMCP
 
 from .client import YouTrackClient, YouTrackError, YouTrackNotFoundError
-from .config import load_config
+from .config import YouTrackConfig, load_config
 
 # Configure logging to stderr (stdout is reserved for MCP protocol)
 logging.basicConfig(
@@ -22,6 +27,140 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+def _json_indent() -> bool:
+    """Whether tool responses should be indented (YOUTRACK_JSON_INDENT)."""
+    try:
+        return _get_config().json_indent
+    except YouTrackError:
+        return False
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response to JSON text, compact unless configured otherwise."""
+    option = orjson.OPT_INDENT_2 if _json_indent() else 0
+    return orjson.dumps(obj, option=option).decode()
+
+
+# Error responses only need the message escaped; the surrounding object is fixed
+_ERROR_TEMPLATE = '{{"error":{}}}'
+_INDENTED_ERROR_TEMPLATE = '{{\n  "error": {}\n}}'
+
+
+def _error(message: str) -> str:
+    """Serialize an error response."""
+    template = _INDENTED_ERROR_TEMPLATE if _json_indent() else _ERROR_TEMPLATE
+    return template.format(orjson.dumps(message).decode())
+
+
+def _not_found(kind: str, identifier: str) -> str:
+    """Serialize a "<kind> '<identifier>' not found" error response."""
+    return _error(f"{kind} '{identifier}' not found")
+
+
+_NO_PROJECT_MESSAGE = "No project specified and YOUTRACK_DEFAULT_PROJECT not configured"
+
+
+# Serialized responses for rarely-changing metadata tools are reused for this many seconds
+RESPONSE_CACHE_TTL = 60.0
+
+
+class _ResponseCache:
+    """TTL cache of serialized tool responses.
+
+    Expired entries are still served while a single background task refreshes
+    them. Only successful responses are stored: if the factory raises, nothing
+    is cached and the error propagates to the tool (or is logged on refresh).
+
+    This is the only cache layer for the tools using it: their factories ask
+    the client for fresh data, so responses are at most ttl seconds stale
+    (plus one refresh) rather than stacking on the client's project cache.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._entries: dict[tuple[Any, ...], tuple[float, str]] = {}
+        self._refreshing: dict[tuple[Any, ...], asyncio.Task[None]] = {}
+
+    async def get_or_set(
+        self, key: tuple[Any, ...], factory: Callable[[], Awaitable[str]]
+    ) -> str:
+        """Return the cached response for key, building it with factory on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            value = await factory()
+            self._entries[key] = (time.monotonic(), value)
+            return value
+
+        fetched_at, value = entry
+        if time.monotonic() - fetched_at > self.ttl and key not in self._refreshing:
+            task = asyncio.create_task(self._refresh(key, factory))
+            self._refreshing[key] = task
+            task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+        return value
+
+    async def _refresh(self, key: tuple[Any, ...], factory: Callable[[], Awaitable[str]]) -> None:
+        try:
+            value = await factory()
+        except Exception:
+            logger.warning("Background refresh of %s failed; serving stale data", key[0])
+            return
+        self._entries[key] = (time.monotonic(), value)
+
+    def invalidate(self, name: str) -> None:
+        """Drop cached responses for one tool, e.g. after its data changed."""
+        for key in [key for key in self._entries if key[0] == name]:
+            del self._entries[key]
+            task = self._refreshing.pop(key, None)
+            if task is not None:
+                task.cancel()
+
+    def clear(self) -> None:
+        """Drop all cached responses and cancel pending refreshes."""
+        for task in self._refreshing.values():
+            task.cancel()
+        self._refreshing.clear()
+        self._entries.clear()
+
+
+_responses = _ResponseCache(RESPONSE_CACHE_TTL)
+
+# Set by lifespan. Tool calls normally run in tasks started after it and so
+# inherit these, but a transport may start request tasks from another context,
+# and direct calls have none. Tools must resolve them through _get_client and
+# _get_config, which fall back to the request's lifespan context and report a
+# missing client as a YouTrackError instead of raising LookupError.
+_client_var: ContextVar[YouTrackClient] = ContextVar("youtrack_client")
+_config_var: ContextVar[YouTrackConfig] = ContextVar("youtrack_config")
+
+_NOT_RUNNING_MESSAGE = "YouTrack client not available: the server lifespan is not running"
+
+
+def _lifespan_resource(var: ContextVar[T], key: str) -> T:
+    """Get a lifespan resource from its context var, or from the current request."""
+    try:
+        return var.get()
+    except LookupError:
+        pass
+    try:
+        # ValueError: FastMCP has no request context outside a request
+        resource: T = mcp.get_context().request_context.lifespan_context[key]
+    except (LookupError, ValueError):
+        raise YouTrackError(_NOT_RUNNING_MESSAGE) from None
+    return resource
+
+
+def _get_client() -> YouTrackClient:
+    """Get the YouTrack client for the running server."""
+    return _lifespan_resource(_client_var, "client")
+
+
+def _get_config() -> YouTrackConfig:
+    """Get the configuration of the running server."""
+    return _lifespan_resource(_config_var, "config")
+
 
 @asynccontextmanager
 async def lifespan(_server: FastMCP) -> AsyncIterator[dict[str, Any]]:
@@ -30,7 +169,14 @@ async def lifespan(_server: FastMCP) -> AsyncIterator[dict[str, Any]]:
     logger.info("YouTrack MCP Server starting, connecting to %s", config.url)
 
     async with YouTrackClient(config) as client:
-        yield {"client": client, "config": config}
+        client_token = _client_var.set(client)
+        config_token = _config_var.set(config)
+        try:
+            yield {"client": client, "config": config}
+        finally:
+            _config_var.reset(config_token)
+            _client_var.reset(client_token)
+            _responses.clear()
 
     logger.info("YouTrack MCP Server shutting down")
 
@@ -42,73 +188,163 @@ mcp = FastMCP(
 )
 
 
+# Sentinel for getattr lookups where None is a meaningful attribute value
+_MISSING = object()
+
+# Fetch all attributes a formatter reads in one C-level call
+_issue_attrs = attrgetter(
+    "id_readable",
+    "id",
+    "summary",
+    "description",
+    "project",
+    "reporter",
+    "created",
+    "updated",
+    "custom_fields",
+)
+_project_attrs = attrgetter("id", "short_name", "name", "description", "archived")
+_comment_attrs = attrgetter("id", "text", "author", "created", "updated")
+_link_issue_attrs = attrgetter("id_readable", "id", "summary")
+
+# Unbound method: skips the per-call attribute lookup on each datetime
+_isoformat = datetime.isoformat
+
+
 def format_issue(issue: Any) -> dict[str, Any]:
     """Format an issue for display."""
+    (
+        id_readable,
+        issue_id,
+        summary,
+        description,
+        project,
+        reporter,
+        created,
+        updated,
+        custom_fields,
+    ) = _issue_attrs(issue)
     result: dict[str, Any] = {
-        "id": issue.id_readable or issue.id,
-        "summary": issue.summary,
+        "id": id_readable or issue_id,
+        "summary": summary,
     }
 
-    if issue.description:
-        result["description"] = issue.description
+    if description:
+        result["description"] = description
 
-    if issue.project:
-        result["project"] = issue.project.short_name or issue.project.name
+    if project:
+        result["project"] = project.short_name or project.name
 
-    if issue.reporter:
-        result["reporter"] = issue.reporter.name or issue.reporter.login
+    if reporter:
+        result["reporter"] = reporter.name or reporter.login
 
-    if issue.created:
-        result["created"] = issue.created.isoformat()
+    if created:
+        result["created"] = _isoformat(created)
 
-    if issue.updated:
-        result["updated"] = issue.updated.isoformat()
+    if updated:
+        result["updated"] = _isoformat(updated)
 
     # Extract key custom fields
-    for field in issue.custom_fields:
-        if field.name and field.value is not None:
-            if hasattr(field.value, "name"):
-                result[field.name] = field.value.name
-            elif isinstance(field.value, list):
-                result[field.name] = [
-                    v.name if hasattr(v, "name") else str(v) for v in field.value
-                ]
-            else:
-                result[field.name] = field.value
+    for field in custom_fields:
+        name = field.name
+        value = field.value
+        if not name or value is None:
+            continue
+        value_name = getattr(value, "name", _MISSING)
+        if value_name is not _MISSING:
+            result[name] = value_name
+        elif type(value) is list:
+            result[name] = [
+                v_name if (v_name := getattr(v, "name", _MISSING)) is not _MISSING else str(v)
+                for v in value
+            ]
+        else:
+            result[name] = value
 
     return result
 
 
 def format_project(project: Any) -> dict[str, Any]:
     """Format a project for display."""
+    project_id, short_name, name, description, archived = _project_attrs(project)
     return {
-        "id": project.id,
-        "shortName": project.short_name,
-        "name": project.name,
-        "description": project.description,
-        "archived": project.archived,
+        "id": project_id,
+        "shortName": short_name,
+        "name": name,
+        "description": description,
+        "archived": archived,
+    }
+
+
+def format_project_field(field: dict[str, Any]) -> dict[str, Any]:
+    """Simplify a raw project custom field definition for display."""
+    field_info: dict[str, Any] = {
+        "id": field.get("id"),
     }
 
+    # Extract field name from nested object
+    if field_obj := field.get("field"):
+        field_info["name"] = field_obj.get("name")
+
+    if "emptyFieldText" in field:
+        field_info["emptyFieldText"] = field["emptyFieldText"]
+
+    if "canBeEmpty" in field:
+        field_info["required"] = not field["canBeEmpty"]
+
+    # Extract possible values from bundle
+    if (bundle := field.get("bundle")) and (values := bundle.get("values")):
+        field_info["values"] = [
+            {"name": v.get("name"), "description": v.get("description")} for v in values
+        ]
+
+    return field_info
+
 
 def format_comment(comment: Any) -> dict[str, Any]:
     """Format a comment for display."""
+    comment_id, text, author, created, updated = _comment_attrs(comment)
     result: dict[str, Any] = {
-        "id": comment.id,
-        "text": comment.text,
+        "id": comment_id,
+        "text": text,
     }
 
-    if comment.author:
-        result["author"] = comment.author.name or comment.author.login
+    if author:
+        result["author"] = author.name or author.login
 
-    if comment.created:
-        result["created"] = comment.created.isoformat()
+    if created:
+        result["created"] = _isoformat(created)
 
-    if comment.updated:
-        result["updated"] = comment.updated.isoformat()
+    if updated:
+        result["updated"] = _isoformat(updated)
 
     return result
 
 
+def format_link(link: Any) -> dict[str, Any]:
+    """Format an issue link for display."""
+    link_info: dict[str, Any] = {
+        "id": link.id,
+        "direction": link.direction,
+    }
+    if link_type := link.link_type:
+        link_info["linkType"] = link_type.name
+        link_info["linkLabel"] = (link_type.target_to_source, link_type.source_to_target)[
+            link.direction == "OUTWARD"
+        ]
+
+    link_info["issues"] = [
+        {"id": id_readable or issue_id, "summary": summary}
+        for id_readable, issue_id, summary in map(_link_issue_attrs, link.issues)
+    ]
+    return link_info
+
+
+def _query_term(prefix: str, value: str) -> str:
+    """Format a search term, using {value} syntax for values with spaces."""
+    return f"{prefix}{{{value}}}" if " " in value else f"{prefix}{value}"
+
+
 @mcp.tool()
 async def search_issues(
     project: str | None = None,
@@ -138,33 +374,23 @@ async def search_issues(
         - search_issues(domain="Security") - All Security domain issues
         - search_issues(query="#Unresolved") - All unresolved issues
     """
-    ctx = mcp.get_context()
-    client: YouTrackClient = ctx.request_context.lifespan_context["client"]
-
     limit = min(max(1, limit), 100)  # Clamp between 1 and 100
 
     # Build the query using correct YouTrack syntax
-    query_parts: list[str] = []
-    if assignee:
-        query_parts.append(f"for: {assignee}")
-    if state:
-        # Use #{State} syntax for states with spaces
-        if " " in state:
-            query_parts.append(f"#{{{state}}}")
-        else:
-            query_parts.append(f"#{state}")
-    if domain:
-        # Use Domain: {value} syntax for domain field
-        if " " in domain:
-            query_parts.append(f"Domain: {{{domain}}}")
-        else:
-            query_parts.append(f"Domain: {domain}")
-    if query:
-        query_parts.append(query)
-
-    built_query = " ".join(query_parts) if query_parts else None
+    query_parts = [
+        part
+        for part in (
+            assignee and f"for: {assignee}",
+            state and _query_term("#", state),
+            domain and _query_term("Domain: ", domain),
+            query,
+        )
+        if part
+    ]
+    built_query = " ".join(query_parts) or None
 
     try:
+        client = _get_client()
         issues = await client.list_issues(
             project=project,
             query=built_query,
@@ -172,12 +398,12 @@ async def search_issues(
         )
 
         # Build display query for response
-        display_parts: list[str] = []
-        if project:
-            display_parts.append(f"project: {project}")
-        if built_query:
-            display_parts.append(built_query)
-        display_query = " ".join(display_parts) if display_parts else None
+        if project and built_query:
+            display_query: str | None = f"project: {project} {built_query}"
+        elif project:
+            display_query = f"project: {project}"
+        else:
+            display_query = built_query
 
         result = {
             "count": len(issues),
@@ -185,10 +411,10 @@ async def search_issues(
             "issues": [format_issue(issue) for issue in issues],
         }
 
-        return json.dumps(result, indent=2, default=str)
+        return _dumps(result)
 
     except YouTrackError as e:
-        return json.dumps({"error": str(e)})
+        return _error(str(e))
 
 
 @mcp.tool()
@@ -201,17 +427,44 @@ async def get_issue(issue_id: str) -> str:
     Returns:
         JSON object with full issue details.
     """
-    ctx = mcp.get_context()
-    client: YouTrackClient = ctx.request_context.lifespan_context["client"]
-
     try:
+        client = _get_client()
         issue = await client.get_issue(issue_id)
-        return json.dumps(format_issue(issue), indent=2, default=str)
+        return _dumps(format_issue(issue))
 
     except YouTrackNotFoundError:
-        return json.dumps({"error": f"Issue '{issue_id}' not found"})
+        return _not_found("Issue", issue_id)
     except YouTrackError as e:
-        return json.dumps({"error": str(e)})
+        return _error(str(e))
+
+
+@mcp.tool()
+async def get_issue_full(issue_id: str) -> str:
+    """Get an issue together with all of its comments and links in one call.
+
+    Prefer this over calling get_issue, list_comments, and list_issue_links
+    separately; the three lookups run concurrently.
+
+    Args:
+        issue_id: The issue ID (e.g., 'OPS-123' or database ID).
+
+    Returns:
+        JSON object with full issue details plus "comments" and "links" arrays.
+    """
+    try:
+        client = _get_client()
+        issue, comments, links = await client.get_issue_bundle(issue_id)
+
+        result = format_issue(issue)
+        result["comments"] = [format_comment(c) for c in comments]
+        result["links"] = [format_link(link) for link in links]
+
+        return _dumps(result)
+
+    except YouTrackNotFoundError:
+        return _not_found("Issue", issue_id)
+    except YouTrackError as e:
+        return _error(str(e))
 
 
 @mcp.tool()
@@ -232,16 +485,14 @@ async def create_issue(
     Returns:
         JSON object with the created issue details including the new issue ID.
     """
-    ctx = mcp.get_context()
-    client: YouTrackClient = ctx.request_context.lifespan_context["client"]
-    config = ctx.request_context.lifespan_context["config"]
-
-    # Use default project if not specified
-    target_project = project or config.default_project
+    try:
+        client = _get_client()
+        # Use default project if not specified
+        target_project = project or _get_config().default_project
+    except YouTrackError as e:
+        return _error(str(e))
     if not target_project:
-        return json.dumps({
-            "error": "No project specified and YOUTRACK_DEFAULT_PROJECT not configured"
-        })
+        return _error(_NO_PROJECT_MESSAGE)
 
     try:
         # First, get the project to get its database ID
@@ -256,20 +507,23 @@ async def create_issue(
         # Set type via command if provided
         if type:
             if not issue.id_readable:
-                return json.dumps({"error": "Created issue missing id_readable field"})
+                return _error("Created issue missing id_readable field")
             await client.execute_command(issue.id_readable, f"Type: {type}")
             # Fetch the updated issue to get the type field
-            issue = await client.get_issue(issue.id_readable)
+            issue = await client.get_issue(issue.id_readable, fresh=True)
 
         result = format_issue(issue)
         result["_created"] = True
 
-        return json.dumps(result, indent=2, default=str)
+        return _dumps(result)
 
     except YouTrackNotFoundError:
-        return json.dumps({"error": f"Project '{target_project}' not found"})
+        # The project may have been removed; don't keep listing it
+        _responses.invalidate("list_projects")
+        _responses.invalidate("get_project_fields")
+        return _not_found("Project", target_project)
     except YouTrackError as e:
-        return json.dumps({"error": str(e)})
+        return _error(str(e))
 
 
 @mcp.tool()
@@ -296,26 +550,25 @@ async def update_issue(
     Returns:
         JSON object with the updated issue details.
     """
-    ctx = mcp.get_context()
-    client: YouTrackClient = ctx.request_context.lifespan_context["client"]
-
     try:
-        # Handle state, assignee, domain, and type via commands
-        if state or assignee or domain or type:
-            commands: list[str] = []
-            if state:
-                commands.append(f"State: {state}")
-            if assignee:
-                commands.append(f"Assignee: {assignee}")
-            if domain:
-                commands.append(f"Domain: {domain}")
-            if type:
-                commands.append(f"Type: {type}")
-
+        client = _get_client()
+        # State, assignee, domain, and type are set via commands
+        commands = [
+            part
+            for part in (
+                state and f"State: {state}",
+                assignee and f"Assignee: {assignee}",
+                domain and f"Domain: {domain}",
+                type and f"Type: {type}",
+            )
+            if part
+        ]
+        # Sequential so a failed command stops before the fields are touched
+        if commands:
             await client.execute_command(issue_id, " ".join(commands))
 
-        # Handle direct field updates
         if summary is not None or description is not None:
+            # The update response already reflects the command above
             issue = await client.update_issue(
                 issue_id=issue_id,
                 summary=summary,
@@ -323,55 +576,50 @@ async def update_issue(
             )
         else:
             # Fetch the updated issue
-            issue = await client.get_issue(issue_id)
+            issue = await client.get_issue(issue_id, fresh=True)
 
         result = format_issue(issue)
         result["_updated"] = True
 
-        return json.dumps(result, indent=2, default=str)
+        return _dumps(result)
 
     except YouTrackNotFoundError:
-        return json.dumps({"error": f"Issue '{issue_id}' not found"})
+        return _not_found("Issue", issue_id)
     except YouTrackError as e:
-        return json.dumps({"error": str(e)})
+        return _error(str(e))
 
 
 @mcp.tool()
-async def delete_issue(issue_id: str) -> str:
+async def delete_issue(issue_id: str, include_summary: bool = False) -> str:
     """Delete an issue from YouTrack.
 
     WARNING: This operation cannot be undone. The issue will be permanently deleted.
 
     Args:
         issue_id: The issue ID to delete (e.g., 'OPS-123').
+        include_summary: Fetch the issue first and include its summary in the
+            response (default False; costs an extra request).
 
     Returns:
         JSON object confirming deletion or error message.
     """
-    ctx = mcp.get_context()
-    client: YouTrackClient = ctx.request_context.lifespan_context["client"]
-
     try:
-        # Get the issue first to confirm it exists and capture details
-        issue = await client.get_issue(issue_id)
-        issue_summary = issue.summary
+        client = _get_client()
+        result: dict[str, Any] = {"deleted": True, "issue_id": issue_id}
+        if include_summary:
+            issue = await client.get_issue(issue_id)
+            result["summary"] = issue.summary
 
+        # A missing issue makes the DELETE itself fail with 404
         await client.delete_issue(issue_id)
 
-        return json.dumps(
-            {
-                "deleted": True,
-                "issue_id": issue_id,
-                "summary": issue_summary,
-                "message": f"Issue {issue_id} has been permanently deleted",
-            },
-            indent=2,
-        )
+        result["message"] = f"Issue {issue_id} has been permanently deleted"
+        return _dumps(result)
 
     except YouTrackNotFoundError:
-        return json.dumps({"error": f"Issue '{issue_id}' not found"})
+        return _not_found("Issue", issue_id)
     except YouTrackError as e:
-        return json.dumps({"error": str(e)})
+        return _error(str(e))
 
 
 @mcp.tool()
@@ -381,21 +629,18 @@ async def list_projects() -> str:
     Returns:
         JSON array of projects with id, shortName, name, and description.
     """
-    ctx = mcp.get_context()
-    client: YouTrackClient = ctx.request_context.lifespan_context["client"]
 
-    try:
-        projects = await client.list_projects()
+    async def build() -> str:
+        projects = await _get_client().list_projects(fresh=True)
+        active = [format_project(p) for p in projects if not p.archived]
 
-        result = {
-            "count": len(projects),
-            "projects": [format_project(p) for p in projects if not p.archived],
-        }
+        return _dumps({"count": len(active), "projects": active})
 
-        return json.dumps(result, indent=2)
+    try:
+        return await _responses.get_or_set(("list_projects",), build)
 
     except YouTrackError as e:
-        return json.dumps({"error": str(e)})
+        return _error(str(e))
 
 
 @mcp.tool()
@@ -411,49 +656,21 @@ async def get_project_fields(project: str) -> str:
     Returns:
         JSON array of custom field definitions with possible values.
     """
-    ctx = mcp.get_context()
-    client: YouTrackClient = ctx.request_context.lifespan_context["client"]
-
-    try:
-        fields = await client.get_project_custom_fields(project)
-
-        # Simplify the field data for readability
-        simplified: list[dict[str, Any]] = []
-        for field in fields:
-            field_info: dict[str, Any] = {
-                "id": field.get("id"),
-            }
-
-            # Extract field name from nested object
-            if "field" in field and field["field"]:
-                field_info["name"] = field["field"].get("name")
-
-            if "emptyFieldText" in field:
-                field_info["emptyFieldText"] = field["emptyFieldText"]
-
-            if "canBeEmpty" in field:
-                field_info["required"] = not field["canBeEmpty"]
 
-            # Extract possible values from bundle
-            if "bundle" in field and field["bundle"]:
-                bundle = field["bundle"]
-                if "values" in bundle and bundle["values"]:
-                    field_info["values"] = [
-                        {"name": v.get("name"), "description": v.get("description")}
-                        for v in bundle["values"]
-                    ]
+    async def build() -> str:
+        fields = await _get_client().get_project_custom_fields(project, fresh=True)
 
-            simplified.append(field_info)
-
-        return json.dumps(
-            {"project": project, "fields": simplified},
-            indent=2,
+        return _dumps(
+            {"project": project, "fields": [format_project_field(f) for f in fields]}
         )
 
+    try:
+        return await _responses.get_or_set(("get_project_fields", project), build)
+
     except YouTrackNotFoundError:
-        return json.dumps({"error": f"Project '{project}' not found"})
+        return _not_found("Project", project)
     except YouTrackError as e:
-        return json.dumps({"error": str(e)})
+        return _error(str(e))
 
 
 @mcp.tool()
@@ -467,22 +684,20 @@ async def add_comment(issue_id: str, text: str) -> str:
     Returns:
         JSON object with the created comment details.
     """
-    ctx = mcp.get_context()
-    client: YouTrackClient = ctx.request_context.lifespan_context["client"]
-
     try:
+        client = _get_client()
         comment = await client.add_comment(issue_id, text)
 
         result = format_comment(comment)
         result["_created"] = True
         result["issue_id"] = issue_id
 
-        return json.dumps(result, indent=2, default=str)
+        return _dumps(result)
 
     except YouTrackNotFoundError:
-        return json.dumps({"error": f"Issue '{issue_id}' not found"})
+        return _not_found("Issue", issue_id)
     except YouTrackError as e:
-        return json.dumps({"error": str(e)})
+        return _error(str(e))
 
 
 @mcp.tool()
@@ -495,10 +710,8 @@ async def list_comments(issue_id: str) -> str:
     Returns:
         JSON array of comments with author, text, and timestamps.
     """
-    ctx = mcp.get_context()
-    client: YouTrackClient = ctx.request_context.lifespan_context["client"]
-
     try:
+        client = _get_client()
         comments = await client.list_comments(issue_id)
 
         result = {
@@ -507,12 +720,12 @@ async def list_comments(issue_id: str) -> str:
             "comments": [format_comment(c) for c in comments],
         }
 
-        return json.dumps(result, indent=2, default=str)
+        return _dumps(result)
 
     except YouTrackNotFoundError:
-        return json.dumps({"error": f"Issue '{issue_id}' not found"})
+        return _not_found("Issue", issue_id)
     except YouTrackError as e:
-        return json.dumps({"error": str(e)})
+        return _error(str(e))
 
 
 @mcp.tool()
@@ -528,26 +741,23 @@ async def delete_comment(issue_id: str, comment_id: str) -> str:
     Returns:
         JSON object confirming deletion or error message.
     """
-    ctx = mcp.get_context()
-    client: YouTrackClient = ctx.request_context.lifespan_context["client"]
-
     try:
+        client = _get_client()
         await client.delete_comment(issue_id, comment_id)
 
-        return json.dumps(
+        return _dumps(
             {
                 "deleted": True,
                 "issue_id": issue_id,
                 "comment_id": comment_id,
                 "message": f"Comment {comment_id} has been permanently deleted from issue {issue_id}",
-            },
-            indent=2,
+            }
         )
 
     except YouTrackNotFoundError:
-        return json.dumps({"error": f"Issue '{issue_id}' or comment '{comment_id}' not found"})
+        return _error(f"Issue '{issue_id}' or comment '{comment_id}' not found")
     except YouTrackError as e:
-        return json.dumps({"error": str(e)})
+        return _error(str(e))
 
 
 @mcp.tool()
@@ -558,11 +768,9 @@ async def list_link_types() -> str:
         JSON array of link types with their directional names.
         Common types: Depend (depends on/is required for), Duplicate, Relate, Subtask.
     """
-    ctx = mcp.get_context()
-    client: YouTrackClient = ctx.request_context.lifespan_context["client"]
 
-    try:
-        link_types = await client.list_link_types()
+    async def build() -> str:
+        link_types = await _get_client().list_link_types()
 
         result = {
             "count": len(link_types),
@@ -577,10 +785,13 @@ async def list_link_types() -> str:
             ],
         }
 
-        return json.dumps(result, indent=2)
+        return _dumps(result)
+
+    try:
+        return await _responses.get_or_set(("list_link_types",), build)
 
     except YouTrackError as e:
-        return json.dumps({"error": str(e)})
+        return _error(str(e))
 
 
 @mcp.tool()
@@ -593,31 +804,11 @@ async def list_issue_links(issue_id: str) -> str:
     Returns:
         JSON object with linked issues grouped by link type and direction.
     """
-    ctx = mcp.get_context()
-    client: YouTrackClient = ctx.request_context.lifespan_context["client"]
-
     try:
+        client = _get_client()
         links = await client.list_issue_links(issue_id)
 
-        formatted_links = []
-        for link in links:
-            link_info: dict[str, Any] = {
-                "id": link.id,
-                "direction": link.direction,
-            }
-            if link.link_type:
-                link_info["linkType"] = link.link_type.name
-                link_info["linkLabel"] = (
-                    link.link_type.source_to_target
-                    if link.direction == "OUTWARD"
-                    else link.link_type.target_to_source
-                )
-
-            link_info["issues"] = [
-                {"id": issue.id_readable or issue.id, "summary": issue.summary}
-                for issue in link.issues
-            ]
-            formatted_links.append(link_info)
+        formatted_links = [format_link(link) for link in links]
 
         result = {
             "issue_id": issue_id,
@@ -625,12 +816,12 @@ async def list_issue_links(issue_id: str) -> str:
             "links": formatted_links,
         }
 
-        return json.dumps(result, indent=2, default=str)
+        return _dumps(result)
 
     except YouTrackNotFoundError:
-        return json.dumps({"error": f"Issue '{issue_id}' not found"})
+        return _not_found("Issue", issue_id)
     except YouTrackError as e:
-        return json.dumps({"error": str(e)})
+        return _error(str(e))
 
 
 @mcp.tool()
@@ -653,24 +844,22 @@ async def add_issue_link(
         - add_issue_link("OPS-123", "OPS-456", "Depend") - OPS-123 depends on OPS-456
         - add_issue_link("OPS-123", "OPS-42", "Duplicate") - OPS-123 duplicates OPS-42
     """
-    ctx = mcp.get_context()
-    client: YouTrackClient = ctx.request_context.lifespan_context["client"]
-
     try:
+        client = _get_client()
         await client.add_issue_link(issue_id, target_issue_id, link_type)
 
-        return json.dumps({
+        return _dumps({
             "success": True,
             "message": f"Added '{link_type}' link: {issue_id} -> {target_issue_id}",
             "issue_id": issue_id,
             "target_issue_id": target_issue_id,
             "link_type": link_type,
-        }, indent=2)
+        })
 
     except YouTrackNotFoundError as e:
-        return json.dumps({"error": str(e)})
+        return _error(str(e))
     except YouTrackError as e:
-        return json.dumps({"error": str(e)})
+        return _error(str(e))
 
 
 @mcp.tool()
@@ -689,24 +878,22 @@ async def remove_issue_link(
     Returns:
         JSON object confirming the link was removed.
     """
-    ctx = mcp.get_context()
-    client: YouTrackClient = ctx.request_context.lifespan_context["client"]
-
     try:
+        client = _get_client()
         await client.remove_issue_link(issue_id, target_issue_id, link_type)
 
-        return json.dumps({
+        return _dumps({
             "success": True,
             "message": f"Removed '{link_type}' link: {issue_id} -> {target_issue_id}",
             "issue_id": issue_id,
             "target_issue_id": target_issue_id,
             "link_type": link_type,
-        }, indent=2)
+        })
 
     except YouTrackNotFoundError as e:
-        return json.dumps({"error": str(e)})
+        return _error(str(e))
     except YouTrackError as e:
-        return json.dumps({"error": str(e)})
+        return _error(str(e))
 
 
 def run_server() -> None:
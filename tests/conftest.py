@@ -1,15 +1,41 @@
-"""Pytest fixtures for mcp_youtrack tests."""
+"""Pytest fixtures for mcp_youtrack tests.
+
+Config and sample payload fixtures are session-scoped and shared; tests must
+treat them as read-only. Sample payloads are checked at session teardown so
+an accidental mutation fails the run.
+"""
 
 from __future__ import annotations
 
-from typing import Any
+import copy
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, TypeVar
 
+import httpx
+import orjson
 import pytest
+import pytest_asyncio
 
+from mcp_youtrack.client import YouTrackClient
 from mcp_youtrack.config import YouTrackConfig
+from mcp_youtrack.models import Issue
+
+T = TypeVar("T")
+
 
+def _read_only(data: T) -> Iterator[T]:
+    """Yield shared sample data, failing teardown if a test mutated it.
 
-@pytest.fixture
+    The payloads stay plain dicts/lists (not MappingProxyType/tuple) because
+    they are also serialized as mock JSON responses and fed to custom field
+    parsing, neither of which accepts the frozen types.
+    """
+    snapshot = copy.deepcopy(data)
+    yield data
+    assert data == snapshot, "a test mutated shared sample data"
+
+
+@pytest.fixture(scope="session")
 def config() -> YouTrackConfig:
     """Create a test configuration."""
     return YouTrackConfig(
@@ -20,10 +46,22 @@ def config() -> YouTrackConfig:
     )
 
 
-@pytest.fixture
-def sample_issue_data() -> dict[str, Any]:
+@pytest_asyncio.fixture(loop_scope="module")
+async def client(config: YouTrackConfig) -> AsyncIterator[YouTrackClient]:
+    """Yield a test client that is already inside its async context.
+
+    Function-scoped on purpose: each client carries its own project cache,
+    in-flight request table and concurrency semaphore. It runs on the
+    module's event loop, matching the client tests.
+    """
+    async with YouTrackClient(config) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def sample_issue_data() -> Iterator[dict[str, Any]]:
     """Sample issue response data from YouTrack API."""
-    return {
+    data = {
         "id": "2-123",
         "idReadable": "TEST-123",
         "summary": "Test issue summary",
@@ -67,24 +105,38 @@ def sample_issue_data() -> dict[str, Any]:
         "commentsCount": 0,
         "votes": 0,
     }
+    yield from _read_only(data)
+
+
+@pytest.fixture(scope="session")
+def sample_issue_json(sample_issue_data: dict[str, Any]) -> bytes:
+    """Sample issue as the raw JSON bytes the client validates."""
+    return orjson.dumps(sample_issue_data)
+
 
+@pytest.fixture(scope="session")
+def parsed_issue(sample_issue_data: dict[str, Any]) -> Issue:
+    """Sample issue validated once; Issue is frozen, so it is safe to share."""
+    return Issue.model_validate(sample_issue_data)
 
-@pytest.fixture
-def sample_project_data() -> dict[str, Any]:
+
+@pytest.fixture(scope="session")
+def sample_project_data() -> Iterator[dict[str, Any]]:
     """Sample project response data from YouTrack API."""
-    return {
+    data = {
         "id": "0-1",
         "name": "Test Project",
         "shortName": "TEST",
         "description": "A test project for unit tests",
         "archived": False,
     }
+    yield from _read_only(data)
 
 
-@pytest.fixture
-def sample_comment_data() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def sample_comment_data() -> Iterator[dict[str, Any]]:
     """Sample comment response data from YouTrack API."""
-    return {
+    data = {
         "id": "4-1",
         "text": "This is a test comment",
         "author": {
@@ -95,12 +147,13 @@ def sample_comment_data() -> dict[str, Any]:
         "created": 1700002000000,
         "updated": None,
     }
+    yield from _read_only(data)
 
 
-@pytest.fixture
-def sample_project_fields_data() -> list[dict[str, Any]]:
+@pytest.fixture(scope="session")
+def sample_project_fields_data() -> Iterator[list[dict[str, Any]]]:
     """Sample project custom fields response data."""
-    return [
+    data = [
         {
             "id": "cf-1",
             "field": {"id": "f-1", "name": "State"},
@@ -131,3 +184,42 @@ def sample_project_fields_data() -> list[dict[str, Any]]:
             },
         },
     ]
+    yield from _read_only(data)
+
+
+@pytest.fixture(scope="session")
+def api_routes(
+    sample_issue_data: dict[str, Any],
+    sample_project_data: dict[str, Any],
+    sample_comment_data: dict[str, Any],
+    sample_project_fields_data: list[dict[str, Any]],
+) -> dict[tuple[str, str], Any]:
+    """JSON bodies served by routed_client, keyed by (method, path)."""
+    return {
+        ("GET", "/api/issues"): [sample_issue_data],
+        ("GET", "/api/issues/TEST-123"): sample_issue_data,
+        ("GET", "/api/issues/TEST-123/comments"): [sample_comment_data],
+        ("GET", "/api/admin/projects"): [sample_project_data],
+        ("GET", "/api/admin/projects/TEST"): sample_project_data,
+        ("GET", "/api/admin/projects/TEST/customFields"): sample_project_fields_data,
+    }
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def routed_client(
+    config: YouTrackConfig, api_routes: dict[tuple[str, str], Any]
+) -> AsyncIterator[YouTrackClient]:
+    """Yield an entered client whose requests are answered from api_routes.
+
+    Happy-path reads use this dict lookup instead of registering pytest-httpx
+    responses; unknown routes get a 404.
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = api_routes.get((request.method, request.url.path))
+        if body is None:
+            return httpx.Response(404, json={"error": "Not found"})
+        return httpx.Response(200, json=body)
+
+    async with YouTrackClient(config, transport=httpx.MockTransport(handler)) as client:
+        yield client
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import re
 from typing import Any
 
+import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
@@ -16,71 +19,151 @@ from mcp_youtrack.client import (
 )
 from mcp_youtrack.config import YouTrackConfig
 
+# Matches the conftest config; endpoints without query params use exact URLs
+_BASE_URL = "https://youtrack.example.com/api"
 
+# Endpoints with varying query strings, compiled once for the module
+_ISSUES_URL = re.compile(r".*/api/issues(\?.*)?$")
+_ISSUE_123_URL = re.compile(r".*/api/issues/TEST-123(\?.*)?$")
+_ISSUE_999_URL = re.compile(r".*/api/issues/TEST-999(\?.*)?$")
+_COMMENTS_URL = re.compile(r".*/api/issues/TEST-123/comments(\?.*)?$")
+_LINKS_URL = re.compile(r".*/api/issues/TEST-123/links(\?.*)?$")
+_PROJECTS_URL = re.compile(r".*/api/admin/projects(\?.*)?$")
+_PROJECT_TEST_URL = re.compile(r".*/api/admin/projects/TEST(\?.*)?$")
+_LINK_TYPES_URL = re.compile(r".*/api/issueLinkTypes(\?.*)?$")
+
+
+# Run every async client test on the module's event loop instead of one per test
+@pytest.mark.asyncio(loop_scope="module")
 class TestYouTrackClient:
     """Tests for YouTrackClient."""
 
-    @pytest.fixture
-    def client(self, config: YouTrackConfig) -> YouTrackClient:
-        """Create a test client instance."""
-        return YouTrackClient(config)
+    async def test_list_issues(self, routed_client: YouTrackClient) -> None:
+        """Test listing issues."""
+        issues = await routed_client.list_issues()
+
+        assert len(issues) == 1
+        assert issues[0].id_readable == "TEST-123"
 
-    async def test_list_issues(
+    async def test_list_issues_with_query(
         self,
         client: YouTrackClient,
         httpx_mock: HTTPXMock,
         sample_issue_data: dict[str, Any],
     ) -> None:
-        """Test listing issues."""
+        """Test listing issues with project filter."""
         httpx_mock.add_response(
-            url=re.compile(r".*/api/issues.*"),
+            url=_ISSUES_URL,
             json=[sample_issue_data],
         )
 
-        async with client:
-            issues = await client.list_issues()
+        issues = await client.list_issues(project="TEST", query="#Open")
 
         assert len(issues) == 1
-        assert issues[0].id_readable == "TEST-123"
+        # Verify the query was constructed correctly
+        request = httpx_mock.get_request(url=_ISSUES_URL)
+        assert request is not None
+        assert "project" in str(request.url)
 
-    async def test_list_issues_with_query(
+    async def test_iter_issues_pages(
         self,
         client: YouTrackClient,
         httpx_mock: HTTPXMock,
         sample_issue_data: dict[str, Any],
     ) -> None:
-        """Test listing issues with project filter."""
+        """Test iterating issues follows $skip until a short page."""
         httpx_mock.add_response(
-            url=re.compile(r".*/api/issues.*"),
+            url=_ISSUES_URL,
             json=[sample_issue_data],
         )
+        httpx_mock.add_response(
+            url=_ISSUES_URL,
+            json=[],
+        )
 
-        async with client:
-            issues = await client.list_issues(project="TEST", query="#Open")
+        issues = [issue async for issue in client.iter_issues(page_size=1)]
 
-        assert len(issues) == 1
-        # Verify the query was constructed correctly
-        request = httpx_mock.get_request()
-        assert request is not None
-        assert "project" in str(request.url)
+        assert [issue.id_readable for issue in issues] == ["TEST-123"]
+        requests = httpx_mock.get_requests()
+        assert len(requests) == 2
+        assert requests[1].url.params["$skip"] == "1"
+
+    @pytest.mark.parametrize("page_size", [0, -1])
+    @pytest.mark.parametrize("method", ["iter_issues", "iter_projects"])
+    async def test_iter_rejects_non_positive_page_size(
+        self,
+        client: YouTrackClient,
+        method: str,
+        page_size: int,
+    ) -> None:
+        """Test paging with page_size < 1 fails instead of requesting the same page forever."""
+        pages = getattr(client, method)(page_size=page_size)
+
+        with pytest.raises(ValueError, match="page_size"):
+            await anext(pages)
+
+    async def test_get_issue(self, routed_client: YouTrackClient) -> None:
+        """Test getting a single issue."""
+        issue = await routed_client.get_issue("TEST-123")
 
-    async def test_get_issue(
+        assert issue.id_readable == "TEST-123"
+        assert issue.summary == "Test issue summary"
+
+    async def test_get_issue_coalesces_concurrent_calls(
         self,
         client: YouTrackClient,
         httpx_mock: HTTPXMock,
         sample_issue_data: dict[str, Any],
     ) -> None:
-        """Test getting a single issue."""
+        """Test that concurrent lookups of the same issue share one request."""
         httpx_mock.add_response(
-            url=re.compile(r".*/api/issues/TEST-123.*"),
+            url=_ISSUE_123_URL,
             json=sample_issue_data,
         )
 
-        async with client:
-            issue = await client.get_issue("TEST-123")
+        first, second = await asyncio.gather(
+            client.get_issue("TEST-123"),
+            client.get_issue("TEST-123"),
+        )
 
-        assert issue.id_readable == "TEST-123"
-        assert issue.summary == "Test issue summary"
+        assert first is second
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test_get_issue_fresh_skips_in_flight_request(
+        self,
+        config: YouTrackConfig,
+        sample_issue_data: dict[str, Any],
+    ) -> None:
+        """Test a fresh read-after-write doesn't reuse a GET started before the write."""
+        releases = {"Before write": asyncio.Event(), "After write": asyncio.Event()}
+        summaries = iter(releases)
+        seen: list[httpx.Request] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            summary = next(summaries)
+            await releases[summary].wait()
+            return httpx.Response(200, json={**sample_issue_data, "summary": summary})
+
+        transport = httpx.MockTransport(handler)
+        async with YouTrackClient(config, transport=transport) as client:
+            stale = asyncio.create_task(client.get_issue("TEST-123"))
+            while len(seen) < 1:
+                await asyncio.sleep(0)
+            fresh = asyncio.create_task(client.get_issue("TEST-123", fresh=True))
+            while len(seen) < 2:
+                await asyncio.sleep(0)
+            # A plain lookup made after the write joins the fresh request
+            joined = asyncio.create_task(client.get_issue("TEST-123"))
+            await asyncio.sleep(0)
+
+            releases["After write"].set()
+            assert (await fresh).summary == "After write"
+            assert (await joined).summary == "After write"
+            releases["Before write"].set()
+            assert (await stale).summary == "Before write"
+
+        assert len(seen) == 2
 
     async def test_get_issue_not_found(
         self,
@@ -89,14 +172,13 @@ class TestYouTrackClient:
     ) -> None:
         """Test 404 error handling."""
         httpx_mock.add_response(
-            url=re.compile(r".*/api/issues/TEST-999.*"),
+            url=_ISSUE_999_URL,
             status_code=404,
             json={"error": "Issue not found"},
         )
 
-        async with client:
-            with pytest.raises(YouTrackNotFoundError):
-                await client.get_issue("TEST-999")
+        with pytest.raises(YouTrackNotFoundError):
+            await client.get_issue("TEST-999")
 
     async def test_create_issue(
         self,
@@ -106,18 +188,17 @@ class TestYouTrackClient:
     ) -> None:
         """Test creating an issue."""
         httpx_mock.add_response(
-            url=re.compile(r".*/api/issues.*"),
+            url=_ISSUES_URL,
             method="POST",
             json=sample_issue_data,
             status_code=200,
         )
 
-        async with client:
-            issue = await client.create_issue(
-                project_id="0-1",
-                summary="New issue",
-                description="Description",
-            )
+        issue = await client.create_issue(
+            project_id="0-1",
+            summary="New issue",
+            description="Description",
+        )
 
         assert issue.id_readable == "TEST-123"
 
@@ -129,16 +210,15 @@ class TestYouTrackClient:
     ) -> None:
         """Test updating an issue."""
         httpx_mock.add_response(
-            url=re.compile(r".*/api/issues/TEST-123.*"),
+            url=_ISSUE_123_URL,
             method="POST",
             json=sample_issue_data,
         )
 
-        async with client:
-            issue = await client.update_issue(
-                issue_id="TEST-123",
-                summary="Updated summary",
-            )
+        issue = await client.update_issue(
+            issue_id="TEST-123",
+            summary="Updated summary",
+        )
 
         assert issue.id_readable == "TEST-123"
 
@@ -149,66 +229,83 @@ class TestYouTrackClient:
     ) -> None:
         """Test deleting an issue."""
         httpx_mock.add_response(
-            url=re.compile(r".*/api/issues/TEST-123"),
+            url=f"{_BASE_URL}/issues/TEST-123",
             method="DELETE",
             status_code=200,
         )
 
-        async with client:
-            result = await client.delete_issue("TEST-123")
+        result = await client.delete_issue("TEST-123")
 
         assert result is True
 
-    async def test_list_projects(
+    async def test_list_projects(self, routed_client: YouTrackClient) -> None:
+        """Test listing projects."""
+        projects = await routed_client.list_projects()
+
+        assert len(projects) == 1
+        assert projects[0].short_name == "TEST"
+
+    async def test_get_project(
         self,
         client: YouTrackClient,
         httpx_mock: HTTPXMock,
         sample_project_data: dict[str, Any],
     ) -> None:
-        """Test listing projects."""
+        """Test getting a project."""
         httpx_mock.add_response(
-            url=re.compile(r".*/api/admin/projects.*"),
-            json=[sample_project_data],
+            url=_PROJECT_TEST_URL,
+            json=sample_project_data,
         )
 
-        async with client:
-            projects = await client.list_projects()
+        project = await client.get_project("TEST")
 
-        assert len(projects) == 1
-        assert projects[0].short_name == "TEST"
+        assert project.short_name == "TEST"
+        assert project.name == "Test Project"
 
-    async def test_get_project(
+    async def test_get_project_caches(
         self,
         client: YouTrackClient,
         httpx_mock: HTTPXMock,
         sample_project_data: dict[str, Any],
     ) -> None:
-        """Test getting a project."""
+        """Test that project lookups are cached until invalidated."""
         httpx_mock.add_response(
-            url=re.compile(r".*/api/admin/projects/TEST.*"),
+            url=_PROJECT_TEST_URL,
             json=sample_project_data,
+            is_reusable=True,
         )
 
-        async with client:
-            project = await client.get_project("TEST")
+        first = await client.get_project("TEST")
+        second = await client.get_project("TEST")
+        assert len(httpx_mock.get_requests()) == 1
+        assert second is first
 
-        assert project.short_name == "TEST"
-        assert project.name == "Test Project"
+        client.invalidate_projects()
+        await client.get_project("TEST")
 
-    async def test_get_project_custom_fields(
+        assert len(httpx_mock.get_requests()) == 2
+
+    async def test_list_projects_seeds_project_cache(
         self,
         client: YouTrackClient,
         httpx_mock: HTTPXMock,
-        sample_project_fields_data: list[dict[str, Any]],
+        sample_project_data: dict[str, Any],
     ) -> None:
-        """Test getting project custom fields."""
+        """Test that listed projects can be looked up without another request."""
         httpx_mock.add_response(
-            url=re.compile(r".*/api/admin/projects/TEST/customFields.*"),
-            json=sample_project_fields_data,
+            url=_PROJECTS_URL,
+            json=[sample_project_data],
         )
 
-        async with client:
-            fields = await client.get_project_custom_fields("TEST")
+        await client.list_projects()
+        project = await client.get_project("TEST")
+
+        assert project.id == sample_project_data["id"]
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test_get_project_custom_fields(self, routed_client: YouTrackClient) -> None:
+        """Test getting project custom fields."""
+        fields = await routed_client.get_project_custom_fields("TEST")
 
         assert len(fields) == 2
         assert fields[0]["field"]["name"] == "State"
@@ -220,16 +317,20 @@ class TestYouTrackClient:
     ) -> None:
         """Test executing a command."""
         httpx_mock.add_response(
-            url=re.compile(r".*/api/commands"),
+            url=f"{_BASE_URL}/commands",
             method="POST",
             status_code=200,
         )
 
-        async with client:
-            await client.execute_command("TEST-123", "State: Done")
+        await client.execute_command("TEST-123", "State: Done")
 
-        request = httpx_mock.get_request()
+        request = httpx_mock.get_request(url=f"{_BASE_URL}/commands")
         assert request is not None
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content) == {
+            "query": "State: Done",
+            "issues": [{"idReadable": "TEST-123"}],
+        }
 
     async def test_add_comment(
         self,
@@ -239,30 +340,18 @@ class TestYouTrackClient:
     ) -> None:
         """Test adding a comment."""
         httpx_mock.add_response(
-            url=re.compile(r".*/api/issues/TEST-123/comments.*"),
+            url=_COMMENTS_URL,
             method="POST",
             json=sample_comment_data,
         )
 
-        async with client:
-            comment = await client.add_comment("TEST-123", "Test comment")
+        comment = await client.add_comment("TEST-123", "Test comment")
 
         assert comment.text == "This is a test comment"
 
-    async def test_list_comments(
-        self,
-        client: YouTrackClient,
-        httpx_mock: HTTPXMock,
-        sample_comment_data: dict[str, Any],
-    ) -> None:
+    async def test_list_comments(self, routed_client: YouTrackClient) -> None:
         """Test listing comments."""
-        httpx_mock.add_response(
-            url=re.compile(r".*/api/issues/TEST-123/comments.*"),
-            json=[sample_comment_data],
-        )
-
-        async with client:
-            comments = await client.list_comments("TEST-123")
+        comments = await routed_client.list_comments("TEST-123")
 
         assert len(comments) == 1
         assert comments[0].text == "This is a test comment"
@@ -274,13 +363,12 @@ class TestYouTrackClient:
     ) -> None:
         """Test deleting a comment."""
         httpx_mock.add_response(
-            url=re.compile(r".*/api/issues/TEST-123/comments/1-1"),
+            url=f"{_BASE_URL}/issues/TEST-123/comments/1-1",
             method="DELETE",
             status_code=200,
         )
 
-        async with client:
-            result = await client.delete_comment("TEST-123", "1-1")
+        result = await client.delete_comment("TEST-123", "1-1")
 
         assert result is True
 
@@ -291,75 +379,215 @@ class TestYouTrackClient:
     ) -> None:
         """Test 404 error when deleting a non-existent comment."""
         httpx_mock.add_response(
-            url=re.compile(r".*/api/issues/TEST-123/comments/invalid-id"),
+            url=f"{_BASE_URL}/issues/TEST-123/comments/invalid-id",
             method="DELETE",
             status_code=404,
             json={"error": "Comment not found"},
         )
 
-        async with client:
-            with pytest.raises(YouTrackNotFoundError):
-                await client.delete_comment("TEST-123", "invalid-id")
+        with pytest.raises(YouTrackNotFoundError):
+            await client.delete_comment("TEST-123", "invalid-id")
 
-    async def test_auth_error(
+    async def test_get_issue_bundle(
         self,
         client: YouTrackClient,
         httpx_mock: HTTPXMock,
+        sample_issue_data: dict[str, Any],
+        sample_comment_data: dict[str, Any],
     ) -> None:
-        """Test 401 authentication error."""
+        """Test fetching an issue with its comments and links."""
+        httpx_mock.add_response(
+            url=_COMMENTS_URL,
+            json=[sample_comment_data],
+        )
+        httpx_mock.add_response(
+            url=_LINKS_URL,
+            json=[],
+        )
         httpx_mock.add_response(
-            url=re.compile(r".*/api/issues.*"),
-            status_code=401,
-            json={"error": "Unauthorized"},
+            url=_ISSUE_123_URL,
+            json=sample_issue_data,
         )
 
-        async with client:
-            with pytest.raises(YouTrackAuthError) as exc_info:
-                await client.list_issues()
+        issue, comments, links = await client.get_issue_bundle("TEST-123")
 
-        assert "Authentication failed" in str(exc_info.value)
+        assert issue.id_readable == "TEST-123"
+        assert len(comments) == 1
+        assert links == []
 
-    async def test_permission_error(
+    async def test_add_issue_link_caches_link_types(
         self,
         client: YouTrackClient,
         httpx_mock: HTTPXMock,
     ) -> None:
-        """Test 403 permission error."""
+        """Test link types are fetched once and reused across link operations."""
+        httpx_mock.add_response(
+            url=_LINK_TYPES_URL,
+            json=[{"id": "lt-1", "name": "Depend", "sourceToTarget": "depends on"}],
+        )
         httpx_mock.add_response(
-            url=re.compile(r".*/api/issues.*"),
-            status_code=403,
-            json={"error": "Forbidden"},
+            url=f"{_BASE_URL}/commands",
+            method="POST",
+            status_code=200,
+            is_reusable=True,
         )
 
-        async with client:
-            with pytest.raises(YouTrackAuthError) as exc_info:
-                await client.list_issues()
+        await client.add_issue_link("TEST-1", "TEST-2", "depend")
+        await client.remove_issue_link("TEST-1", "TEST-2", "Depend")
 
-        assert "Permission denied" in str(exc_info.value)
+        assert len(httpx_mock.get_requests(url=_LINK_TYPES_URL)) == 1
 
-    async def test_server_error(
+    async def test_add_issue_link_unknown_type(
         self,
         client: YouTrackClient,
         httpx_mock: HTTPXMock,
     ) -> None:
-        """Test 500 server error."""
+        """Test error when the link type name doesn't exist."""
         httpx_mock.add_response(
-            url=re.compile(r".*/api/issues.*"),
-            status_code=500,
-            text="Internal Server Error",
+            url=_LINK_TYPES_URL,
+            json=[{"id": "lt-1", "name": "Depend", "sourceToTarget": "depends on"}],
         )
 
-        async with client:
-            with pytest.raises(YouTrackError) as exc_info:
-                await client.list_issues()
+        with pytest.raises(YouTrackError) as exc_info:
+            await client.add_issue_link("TEST-1", "TEST-2", "Blocks")
 
-        assert "API error (500)" in str(exc_info.value)
+        assert "Available types: Depend" in str(exc_info.value)
 
-    async def test_client_not_initialized_error(
+    async def test_link_type_name_collision_keeps_first(
         self,
         client: YouTrackClient,
+        httpx_mock: HTTPXMock,
+    ) -> None:
+        """Test names differing only in case resolve to the first listed type."""
+        httpx_mock.add_response(
+            url=_LINK_TYPES_URL,
+            json=[
+                {"id": "lt-1", "name": "Depend", "sourceToTarget": "depends on"},
+                {"id": "lt-2", "name": "DEPEND", "sourceToTarget": "DEPENDS ON"},
+            ],
+        )
+
+        link_type = await client._get_link_type("depend")
+
+        assert link_type.id == "lt-1"
+
+    async def test_unknown_link_type_refetches_stale_cache(
+        self,
+        client: YouTrackClient,
+        httpx_mock: HTTPXMock,
+    ) -> None:
+        """Test a name missing from the cached listing is looked up once more."""
+        httpx_mock.add_response(
+            url=_LINK_TYPES_URL,
+            json=[{"id": "lt-1", "name": "Depend", "sourceToTarget": "depends on"}],
+        )
+        httpx_mock.add_response(
+            url=_LINK_TYPES_URL,
+            json=[
+                {"id": "lt-1", "name": "Depend", "sourceToTarget": "depends on"},
+                {"id": "lt-2", "name": "Relates", "sourceToTarget": "relates to"},
+            ],
+        )
+
+        await client._get_link_type("Depend")
+        link_type = await client._get_link_type("relates")
+
+        assert link_type.id == "lt-2"
+        assert len(httpx_mock.get_requests(url=_LINK_TYPES_URL)) == 2
+
+    @pytest.mark.parametrize(
+        ("status", "body", "exc_type", "message"),
+        [
+            (401, {"json": {"error": "Unauthorized"}}, YouTrackAuthError, "Authentication failed"),
+            (403, {"json": {"error": "Forbidden"}}, YouTrackAuthError, "Permission denied"),
+            (404, {"json": {"error": "Not found"}}, YouTrackNotFoundError, "Resource not found"),
+            (500, {"text": "Internal Server Error"}, YouTrackError, "API error (500)"),
+            (
+                400,
+                {"json": {"error": "bad_request", "error_description": "Invalid query"}},
+                YouTrackError,
+                "API error (400): Invalid query",
+            ),
+        ],
+        ids=["auth", "permission", "not_found", "server", "error_description"],
+    )
+    async def test_error_mapping(
+        self,
+        client: YouTrackClient,
+        httpx_mock: HTTPXMock,
+        status: int,
+        body: dict[str, Any],
+        exc_type: type[YouTrackError],
+        message: str,
+    ) -> None:
+        """Test error responses map to the matching exception and message."""
+        httpx_mock.add_response(url=_ISSUES_URL, status_code=status, **body)
+
+        with pytest.raises(exc_type) as exc_info:
+            await client.list_issues()
+
+        assert message in str(exc_info.value)
+        assert exc_info.value.status_code == status
+
+    async def test_injected_transport(
+        self,
+        config: YouTrackConfig,
+        sample_issue_data: dict[str, Any],
+    ) -> None:
+        """Test requests go through a transport passed to the constructor."""
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json=sample_issue_data)
+
+        async with YouTrackClient(config, transport=httpx.MockTransport(handler)) as client:
+            issue = await client.get_issue("TEST-123")
+
+        assert issue.id_readable == "TEST-123"
+        assert len(seen) == 1
+        assert seen[0].url.path == "/api/issues/TEST-123"
+        assert seen[0].headers["Authorization"] == "Bearer test-token-123"
+
+    async def test_client_uses_pooling_limits(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the default client is sized from the config and keeps env proxy support."""
+        client_kwargs: list[dict[str, Any]] = []
+        real_client = httpx.AsyncClient
+
+        def recording_client(**kwargs: Any) -> httpx.AsyncClient:
+            client_kwargs.append(kwargs)
+            return real_client(**kwargs)
+
+        monkeypatch.setattr(httpx, "AsyncClient", recording_client)
+        config = YouTrackConfig(
+            url="https://youtrack.example.com",
+            token="test-token",
+            max_connections=8,
+            max_keepalive_connections=4,
+        )
+        async with YouTrackClient(config):
+            pass
+
+        assert len(client_kwargs) == 1
+        assert client_kwargs[0]["limits"] == httpx.Limits(
+            max_connections=8,
+            max_keepalive_connections=4,
+            keepalive_expiry=60,
+        )
+        assert client_kwargs[0]["http2"] is True
+        # httpx only reads proxy environment variables when no transport is passed
+        assert client_kwargs[0]["transport"] is None
+
+
+class TestYouTrackClientSync:
+    """Synchronous YouTrackClient tests that need no event loop."""
+
+    def test_client_not_initialized_error(
+        self,
+        config: YouTrackConfig,
     ) -> None:
         """Test error when client used outside context manager."""
+        client = YouTrackClient(config)
         with pytest.raises(RuntimeError) as exc_info:
             _ = client.client
 
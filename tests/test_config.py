@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import os
-from unittest.mock import patch
+from collections.abc import Callable
+from dataclasses import FrozenInstanceError
 
 import pytest
 
 from mcp_youtrack.config import YouTrackConfig, load_config
 
+SetEnv = Callable[[dict[str, str]], None]
+
 
 class TestYouTrackConfig:
     """Tests for YouTrackConfig dataclass."""
@@ -25,10 +28,31 @@ class TestYouTrackConfig:
         )
         assert config.api_url == "https://youtrack.example.com/api"
 
+    def test_derived_values_are_precomputed(self, config: YouTrackConfig) -> None:
+        """Test derived values are stored once, not rebuilt on each access."""
+        assert config.api_url is config.api_url
+        assert config.auth_header is config.auth_header
+        assert config.default_headers is config.default_headers
+
     def test_auth_header(self, config: YouTrackConfig) -> None:
         """Test authorization header format."""
         assert config.auth_header == {"Authorization": "Bearer test-token-123"}
 
+    def test_default_headers(self, config: YouTrackConfig) -> None:
+        """Test prebuilt request headers include auth and JSON content types."""
+        assert config.default_headers["Authorization"] == "Bearer test-token-123"
+        assert config.default_headers["Accept"] == "application/json"
+        assert config.default_headers["Content-Type"] == "application/json"
+
+    def test_config_is_immutable(self, config: YouTrackConfig) -> None:
+        """Test that config and its derived headers can't be mutated."""
+        with pytest.raises(FrozenInstanceError):
+            config.token = "other-token"  # type: ignore[misc]
+        with pytest.raises(TypeError):
+            config.auth_header["Authorization"] = "Bearer other"  # type: ignore[index]
+        with pytest.raises(TypeError):
+            config.default_headers["Authorization"] = "Bearer other"  # type: ignore[index]
+
     def test_default_values(self) -> None:
         """Test default configuration values."""
         config = YouTrackConfig(
@@ -38,12 +62,34 @@ class TestYouTrackConfig:
         assert config.timeout == 30
         assert config.verify_ssl is True
         assert config.default_project is None
+        assert config.max_concurrency == 10
+        assert config.max_connections == 50
+        assert config.max_keepalive_connections == 20
+        assert config.json_indent is False
+
+
+@pytest.fixture
+def yt_env(monkeypatch: pytest.MonkeyPatch) -> SetEnv:
+    """Return a setter that replaces the YOUTRACK_* environment for one test.
+
+    Only the touched keys are restored on teardown, and load_dotenv is
+    stubbed so a local .env file can't leak into the test.
+    """
+    monkeypatch.setattr("mcp_youtrack.config.load_dotenv", lambda: False)
+
+    def set_env(env: dict[str, str]) -> None:
+        for key in [k for k in os.environ if k.startswith("YOUTRACK_")]:
+            monkeypatch.delenv(key)
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+
+    return set_env
 
 
 class TestLoadConfig:
     """Tests for load_config function."""
 
-    def test_load_config_success(self) -> None:
+    def test_load_config_success(self, yt_env: SetEnv) -> None:
         """Test successful config loading from environment."""
         env = {
             "YOUTRACK_URL": "https://youtrack.example.com",
@@ -51,56 +97,77 @@ class TestLoadConfig:
             "YOUTRACK_DEFAULT_PROJECT": "TEST",
             "YOUTRACK_TIMEOUT": "60",
             "YOUTRACK_VERIFY_SSL": "true",
+            "YOUTRACK_MAX_CONCURRENCY": "4",
+            "YOUTRACK_MAX_CONNECTIONS": "100",
+            "YOUTRACK_MAX_KEEPALIVE_CONNECTIONS": "40",
+            "YOUTRACK_JSON_INDENT": "true",
         }
-        with patch.dict(os.environ, env, clear=True):
-            config = load_config()
-            assert config.url == "https://youtrack.example.com"
-            assert config.token == "perm:test-token"
-            assert config.default_project == "TEST"
-            assert config.timeout == 60
-            assert config.verify_ssl is True
-
-    def test_load_config_missing_url(self) -> None:
+        yt_env(env)
+        config = load_config()
+        assert config.url == "https://youtrack.example.com"
+        assert config.token == "perm:test-token"
+        assert config.default_project == "TEST"
+        assert config.timeout == 60
+        assert config.verify_ssl is True
+        assert config.max_concurrency == 4
+        assert config.max_connections == 100
+        assert config.max_keepalive_connections == 40
+        assert config.json_indent is True
+
+    def test_load_config_missing_url(self, yt_env: SetEnv) -> None:
         """Test error when URL is missing."""
         env = {"YOUTRACK_TOKEN": "test-token"}
-        with patch.dict(os.environ, env, clear=True), pytest.raises(SystemExit):
+        yt_env(env)
+        with pytest.raises(SystemExit):
             load_config()
 
-    def test_load_config_missing_token(self) -> None:
+    def test_load_config_missing_token(self, yt_env: SetEnv) -> None:
         """Test error when token is missing."""
         env = {"YOUTRACK_URL": "https://youtrack.example.com"}
-        with patch.dict(os.environ, env, clear=True), pytest.raises(SystemExit):
+        yt_env(env)
+        with pytest.raises(SystemExit):
             load_config()
 
-    def test_load_config_invalid_timeout(self) -> None:
+    def test_load_config_invalid_timeout(self, yt_env: SetEnv) -> None:
         """Test fallback when timeout is invalid."""
         env = {
             "YOUTRACK_URL": "https://youtrack.example.com",
             "YOUTRACK_TOKEN": "test-token",
             "YOUTRACK_TIMEOUT": "invalid",
         }
-        with patch.dict(os.environ, env, clear=True):
-            config = load_config()
-            assert config.timeout == 30
-
-    def test_load_config_ssl_verification_disabled(self) -> None:
-        """Test SSL verification can be disabled."""
-        env = {
-            "YOUTRACK_URL": "https://youtrack.example.com",
-            "YOUTRACK_TOKEN": "test-token",
-            "YOUTRACK_VERIFY_SSL": "false",
-        }
-        with patch.dict(os.environ, env, clear=True):
-            config = load_config()
-            assert config.verify_ssl is False
+        yt_env(env)
+        config = load_config()
+        assert config.timeout == 30
 
-    def test_load_config_ssl_verification_disabled_zero(self) -> None:
-        """Test SSL verification can be disabled with 0."""
+    def test_load_config_invalid_max_concurrency(self, yt_env: SetEnv) -> None:
+        """Test fallback when max concurrency is not a positive integer."""
         env = {
             "YOUTRACK_URL": "https://youtrack.example.com",
             "YOUTRACK_TOKEN": "test-token",
-            "YOUTRACK_VERIFY_SSL": "0",
+            "YOUTRACK_MAX_CONCURRENCY": "0",
         }
-        with patch.dict(os.environ, env, clear=True):
-            config = load_config()
-            assert config.verify_ssl is False
+        yt_env(env)
+        config = load_config()
+        assert config.max_concurrency == 10
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("true", True),
+            ("1", True),
+            ("false", False),
+            ("FALSE", False),
+            ("0", False),
+            ("no", False),
+        ],
+    )
+    def test_load_config_ssl_verification(self, yt_env: SetEnv, value: str, expected: bool) -> None:
+        """Test YOUTRACK_VERIFY_SSL parsing, case-insensitively."""
+        yt_env(
+            {
+                "YOUTRACK_URL": "https://youtrack.example.com",
+                "YOUTRACK_TOKEN": "test-token",
+                "YOUTRACK_VERIFY_SSL": value,
+            }
+        )
+        assert load_config().verify_ssl is expected
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
+from decimal import Decimal
 from typing import Any
 
+import pytest
+from pydantic import ValidationError
+
 from mcp_youtrack.models import (
     Comment,
     CustomField,
@@ -94,6 +98,18 @@ class TestCustomField:
         field = CustomField.model_validate(data)
         assert field.value is None
 
+    def test_parse_scalar_value(self) -> None:
+        """Test parsing a custom field with a plain JSON scalar value."""
+        data = {"id": "cf-1", "name": "Estimate", "value": 3}
+        field = CustomField.model_validate(data)
+        assert field.value == 3
+
+    def test_non_json_value_coerced_to_string(self) -> None:
+        """Test a value outside the JSON types falls back to its string form."""
+        data = {"id": "cf-1", "name": "Points", "value": Decimal("1.5")}
+        field = CustomField.model_validate(data)
+        assert field.value == "1.5"
+
 
 class TestComment:
     """Tests for Comment model."""
@@ -112,9 +128,9 @@ class TestComment:
 class TestIssue:
     """Tests for Issue model."""
 
-    def test_parse_issue(self, sample_issue_data: dict[str, Any]) -> None:
-        """Test parsing an issue from API response."""
-        issue = Issue.model_validate(sample_issue_data)
+    def test_parse_issue(self, sample_issue_json: bytes) -> None:
+        """Test parsing an issue from a raw API response body."""
+        issue = Issue.model_validate_json(sample_issue_json)
         assert issue.id == "2-123"
         assert issue.id_readable == "TEST-123"
         assert issue.summary == "Test issue summary"
@@ -125,72 +141,66 @@ class TestIssue:
         assert issue.reporter.login == "testuser"
         assert len(issue.custom_fields) == 3
 
-    def test_parse_timestamps(self, sample_issue_data: dict[str, Any]) -> None:
+    def test_parse_timestamps(self, parsed_issue: Issue) -> None:
         """Test timestamp parsing (milliseconds to datetime)."""
-        issue = Issue.model_validate(sample_issue_data)
-        assert issue.created is not None
-        assert isinstance(issue.created, datetime)
-        assert issue.updated is not None
-        assert issue.resolved is None
+        assert parsed_issue.created is not None
+        assert isinstance(parsed_issue.created, datetime)
+        assert parsed_issue.created == datetime(2023, 11, 14, 22, 13, 20, tzinfo=timezone.utc)
+        assert parsed_issue.updated is not None
+        assert parsed_issue.resolved is None
 
-    def test_get_field_value(self, sample_issue_data: dict[str, Any]) -> None:
+    def test_get_field_value(self, parsed_issue: Issue) -> None:
         """Test getting custom field value by name."""
-        issue = Issue.model_validate(sample_issue_data)
-        assert issue.get_field_value("State") == "Open"
-        assert issue.get_field_value("Type") == "Bug"
-        assert issue.get_field_value("NonExistent") is None
+        assert parsed_issue.get_field_value("State") == "Open"
+        assert parsed_issue.get_field_value("Type") == "Bug"
+        assert parsed_issue.get_field_value("NonExistent") is None
+
+    def test_issue_is_immutable(self, parsed_issue: Issue) -> None:
+        """Test that parsed issues are frozen but still index custom fields."""
+        with pytest.raises(ValidationError):
+            parsed_issue.summary = "Changed"
+        assert parsed_issue.get_field_value("State") == "Open"
+
+
+# Built once at import; to_api_payload doesn't mutate the models
+_CREATE_CASES = [
+    (
+        IssueCreate(project="proj-123", summary="New issue", description="Issue description"),
+        {
+            "project": {"id": "proj-123"},
+            "summary": "New issue",
+            "description": "Issue description",
+        },
+    ),
+    (
+        IssueCreate(project="proj-123", summary="New issue"),
+        {"project": {"id": "proj-123"}, "summary": "New issue"},
+    ),
+]
+
+_UPDATE_CASES = [
+    (
+        IssueUpdate(summary="Updated summary", description="Updated description"),
+        {"summary": "Updated summary", "description": "Updated description"},
+    ),
+    (IssueUpdate(summary="Updated summary"), {"summary": "Updated summary"}),
+    (IssueUpdate(), {}),
+]
 
 
 class TestIssueCreate:
     """Tests for IssueCreate model."""
 
-    def test_to_api_payload(self) -> None:
+    @pytest.mark.parametrize(("model", "expected"), _CREATE_CASES, ids=["full", "no_description"])
+    def test_to_api_payload(self, model: IssueCreate, expected: dict[str, Any]) -> None:
         """Test converting to API payload."""
-        create = IssueCreate(
-            project="proj-123",
-            summary="New issue",
-            description="Issue description",
-        )
-        payload = create.to_api_payload()
-        assert payload == {
-            "project": {"id": "proj-123"},
-            "summary": "New issue",
-            "description": "Issue description",
-        }
-
-    def test_to_api_payload_no_description(self) -> None:
-        """Test payload without description."""
-        create = IssueCreate(
-            project="proj-123",
-            summary="New issue",
-        )
-        payload = create.to_api_payload()
-        assert "description" not in payload
+        assert model.to_api_payload() == expected
 
 
 class TestIssueUpdate:
     """Tests for IssueUpdate model."""
 
-    def test_to_api_payload(self) -> None:
+    @pytest.mark.parametrize(("model", "expected"), _UPDATE_CASES, ids=["full", "partial", "empty"])
+    def test_to_api_payload(self, model: IssueUpdate, expected: dict[str, Any]) -> None:
         """Test converting to API payload."""
-        update = IssueUpdate(
-            summary="Updated summary",
-            description="Updated description",
-        )
-        payload = update.to_api_payload()
-        assert payload == {
-            "summary": "Updated summary",
-            "description": "Updated description",
-        }
-
-    def test_to_api_payload_partial(self) -> None:
-        """Test payload with only summary."""
-        update = IssueUpdate(summary="Updated summary")
-        payload = update.to_api_payload()
-        assert payload == {"summary": "Updated summary"}
-
-    def test_to_api_payload_empty(self) -> None:
-        """Test empty payload."""
-        update = IssueUpdate()
-        payload = update.to_api_payload()
-        assert payload == {}
+        assert model.to_api_payload() == expected
@@ -0,0 +1,379 @@
+"""Tests for MCP server tools and response helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+import httpx
+import orjson
+import pytest
+from mcp.server.lowlevel.server import request_ctx
+from mcp.shared.context import RequestContext
+
+from mcp_youtrack import server
+from mcp_youtrack.client import YouTrackClient
+from mcp_youtrack.config import YouTrackConfig
+
+
+class FakeYouTrack:
+    """Route table standing in for the YouTrack API, recording each request."""
+
+    def __init__(self) -> None:
+        self.routes: dict[tuple[str, str], tuple[int, Any]] = {}
+        self.requests: list[httpx.Request] = []
+
+    def add(self, method: str, path: str, body: Any, status: int = 200) -> None:
+        """Answer method + /api path with a JSON body."""
+        self.routes[(method, f"/api{path}")] = (status, body)
+
+    def count(self, method: str, path: str) -> int:
+        """Number of requests received for method + /api path."""
+        return sum(1 for r in self.requests if (r.method, r.url.path) == (method, f"/api{path}"))
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        status, body = self.routes.get(
+            (request.method, request.url.path), (404, {"error": "Not found"})
+        )
+        return httpx.Response(status, json=body)
+
+
+@pytest.fixture
+async def api(config: YouTrackConfig) -> AsyncIterator[FakeYouTrack]:
+    """Run tools against a fake API, as lifespan would set them up."""
+    fake = FakeYouTrack()
+    transport = httpx.MockTransport(fake.handler)
+    async with YouTrackClient(config, transport=transport) as client:
+        client_token = server._client_var.set(client)
+        config_token = server._config_var.set(config)
+        try:
+            yield fake
+        finally:
+            server._config_var.reset(config_token)
+            server._client_var.reset(client_token)
+            server._responses.clear()
+
+
+async def _wait_for(condition: Any) -> None:
+    """Let background tasks run until condition() holds."""
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition not reached")
+
+
+class TestResponseCache:
+    """Tests for the serialized tool response cache."""
+
+    async def test_hit_reuses_response(self) -> None:
+        """Test a fresh entry is served without calling the factory again."""
+        cache = server._ResponseCache(ttl=60.0)
+        calls = 0
+
+        async def build() -> str:
+            nonlocal calls
+            calls += 1
+            return f"v{calls}"
+
+        assert await cache.get_or_set(("tool",), build) == "v1"
+        assert await cache.get_or_set(("tool",), build) == "v1"
+        assert calls == 1
+
+    async def test_expired_entry_served_while_refreshing(self) -> None:
+        """Test an expired entry is returned stale and refreshed in the background."""
+        cache = server._ResponseCache(ttl=0.0)
+        calls = 0
+
+        async def build() -> str:
+            nonlocal calls
+            calls += 1
+            return f"v{calls}"
+
+        assert await cache.get_or_set(("tool",), build) == "v1"
+        assert await cache.get_or_set(("tool",), build) == "v1"
+        await _wait_for(lambda: calls == 2)
+        await _wait_for(lambda: not cache._refreshing)
+
+        assert await cache.get_or_set(("tool",), build) == "v2"
+        cache.clear()
+
+    async def test_failed_refresh_keeps_stale_entry(self) -> None:
+        """Test a refresh error is logged and the previous response kept."""
+        cache = server._ResponseCache(ttl=0.0)
+
+        async def build() -> str:
+            return "v1"
+
+        async def fail() -> str:
+            raise RuntimeError("boom")
+
+        await cache.get_or_set(("tool",), build)
+        assert await cache.get_or_set(("tool",), fail) == "v1"
+        await _wait_for(lambda: not cache._refreshing)
+
+        assert cache._entries[("tool",)][1] == "v1"
+        cache.clear()
+
+    async def test_invalidate_drops_only_that_tool(self) -> None:
+        """Test invalidate removes every entry for a tool name and nothing else."""
+        cache = server._ResponseCache(ttl=60.0)
+
+        async def build() -> str:
+            return "value"
+
+        await cache.get_or_set(("fields", "A"), build)
+        await cache.get_or_set(("fields", "B"), build)
+        await cache.get_or_set(("projects",), build)
+
+        cache.invalidate("fields")
+
+        assert list(cache._entries) == [("projects",)]
+
+
+class TestCachedTools:
+    """Tests for tools served from the response cache."""
+
+    async def test_list_projects_refresh_bypasses_client_cache(
+        self,
+        api: FakeYouTrack,
+        sample_project_data: dict[str, Any],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a background refresh re-reads YouTrack, not the client's project cache."""
+        api.add("GET", "/admin/projects", [sample_project_data])
+        monkeypatch.setattr(server._responses, "ttl", 0.0)
+
+        first = await server.list_projects()
+        assert await server.list_projects() == first
+        await _wait_for(lambda: api.count("GET", "/admin/projects") == 2)
+
+    async def test_create_issue_not_found_invalidates_project_listing(
+        self,
+        api: FakeYouTrack,
+        sample_project_data: dict[str, Any],
+    ) -> None:
+        """Test a project rejected by create_issue is no longer served from cache."""
+        api.add("GET", "/admin/projects", [sample_project_data])
+        api.add("POST", "/issues", {"error": "Project not found"}, status=404)
+
+        await server.list_projects()
+        await server.list_projects()
+        assert api.count("GET", "/admin/projects") == 1
+
+        result = await server.create_issue(summary="New issue", project="TEST")
+        assert result == '{"error":"Project \'TEST\' not found"}'
+
+        await server.list_projects()
+        assert api.count("GET", "/admin/projects") == 2
+
+
+class TestListComments:
+    """Tests for the list_comments tool."""
+
+    async def test_one_request_per_call(
+        self,
+        api: FakeYouTrack,
+        sample_comment_data: dict[str, Any],
+    ) -> None:
+        """Test each call fetches the comments once, with no extra version probe."""
+        api.add("GET", "/issues/TEST-123/comments", [sample_comment_data])
+
+        first = await server.list_comments("TEST-123")
+        second = await server.list_comments("TEST-123")
+
+        assert first == second
+        assert '"count":1' in first
+        assert len(api.requests) == 2
+
+
+class TestUpdateIssue:
+    """Tests for the update_issue tool."""
+
+    async def test_command_runs_before_field_update(
+        self,
+        api: FakeYouTrack,
+        sample_issue_data: dict[str, Any],
+    ) -> None:
+        """Test the command is applied first and the update response is returned."""
+        api.add("POST", "/commands", {})
+        api.add("POST", "/issues/TEST-123", sample_issue_data)
+
+        result = await server.update_issue("TEST-123", summary="New", state="Done")
+
+        assert '"_updated":true' in result
+        assert [r.url.path for r in api.requests] == ["/api/commands", "/api/issues/TEST-123"]
+
+    async def test_failed_command_skips_field_update(self, api: FakeYouTrack) -> None:
+        """Test a rejected command stops before the summary or description is written."""
+        api.add("POST", "/commands", {"error": "Unknown state"}, status=400)
+
+        result = await server.update_issue("TEST-123", summary="New", state="Bogus")
+
+        assert '"error"' in result
+        assert api.count("POST", "/issues/TEST-123") == 0
+
+
+class TestGetIssueFull:
+    """Tests for the get_issue_full tool."""
+
+    async def test_bundles_issue_comments_and_links(
+        self,
+        api: FakeYouTrack,
+        sample_issue_data: dict[str, Any],
+        sample_comment_data: dict[str, Any],
+    ) -> None:
+        """Test the issue is returned with its comments and links attached."""
+        api.add("GET", "/issues/TEST-123", sample_issue_data)
+        api.add("GET", "/issues/TEST-123/comments", [sample_comment_data])
+        api.add(
+            "GET",
+            "/issues/TEST-123/links",
+            [
+                {
+                    "id": "L-1",
+                    "direction": "OUTWARD",
+                    "linkType": {
+                        "name": "Depend",
+                        "sourceToTarget": "depends on",
+                        "targetToSource": "is required for",
+                    },
+                    "issues": [{"id": "2-456", "idReadable": "TEST-456", "summary": "Other"}],
+                }
+            ],
+        )
+
+        result = orjson.loads(await server.get_issue_full("TEST-123"))
+
+        assert result["id"] == "TEST-123"
+        assert [c["id"] for c in result["comments"]] == [sample_comment_data["id"]]
+        assert result["links"] == [
+            {
+                "id": "L-1",
+                "direction": "OUTWARD",
+                "linkType": "Depend",
+                "linkLabel": "depends on",
+                "issues": [{"id": "TEST-456", "summary": "Other"}],
+            }
+        ]
+        assert len(api.requests) == 3
+
+    async def test_links_failure_returns_error(
+        self,
+        api: FakeYouTrack,
+        sample_issue_data: dict[str, Any],
+        sample_comment_data: dict[str, Any],
+    ) -> None:
+        """Test a failed links request yields an error, not a partial bundle."""
+        api.add("GET", "/issues/TEST-123", sample_issue_data)
+        api.add("GET", "/issues/TEST-123/comments", [sample_comment_data])
+        api.add("GET", "/issues/TEST-123/links", {"error": "boom"}, status=500)
+
+        result = orjson.loads(await server.get_issue_full("TEST-123"))
+
+        assert result == {"error": "API error (500): boom"}
+
+
+class TestErrorResponses:
+    """Tests for the templated error responses."""
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "plain",
+            'has "quotes" and \\backslashes\\',
+            "multi\nline\ttabbed\r",
+            "braces {} and {0} placeholders",
+            "unicode ✓ and \x00 control",
+        ],
+    )
+    def test_error_matches_serialized_object(self, message: str) -> None:
+        """Test _error escapes the message exactly as serializing the object would."""
+        result = server._error(message)
+
+        assert result == orjson.dumps({"error": message}).decode()
+        assert orjson.loads(result) == {"error": message}
+
+    def test_not_found_quotes_identifier(self) -> None:
+        """Test _not_found embeds an identifier containing quotes and newlines safely."""
+        result = server._not_found("Issue", 'TEST-"1"\nx')
+
+        assert orjson.loads(result) == {"error": "Issue 'TEST-\"1\"\nx' not found"}
+
+
+class TestJsonIndent:
+    """Tests for YOUTRACK_JSON_INDENT handling in tool responses."""
+
+    @pytest.fixture
+    def indented(self, config: YouTrackConfig) -> Iterator[None]:
+        """Serve responses as if YOUTRACK_JSON_INDENT were enabled."""
+        token = server._config_var.set(dataclasses.replace(config, json_indent=True))
+        try:
+            yield
+        finally:
+            server._config_var.reset(token)
+
+    def test_dumps_compact_by_default(self, config: YouTrackConfig) -> None:
+        """Test responses are compact when indentation is not configured."""
+        token = server._config_var.set(config)
+        try:
+            assert server._dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+        finally:
+            server._config_var.reset(token)
+
+    def test_dumps_compact_without_config(self) -> None:
+        """Test responses are compact outside a server lifespan."""
+        assert server._dumps({"a": 1}) == '{"a":1}'
+
+    @pytest.mark.usefixtures("indented")
+    def test_dumps_indented(self) -> None:
+        """Test responses are indented by two spaces when configured."""
+        assert server._dumps({"a": [1, 2]}) == '{\n  "a": [\n    1,\n    2\n  ]\n}'
+
+    @pytest.mark.usefixtures("indented")
+    def test_error_indented_matches_dumps(self) -> None:
+        """Test the indented error template matches indented serialization."""
+        message = 'bad "value"\nhere'
+
+        assert server._error(message) == server._dumps({"error": message})
+        assert orjson.loads(server._error(message)) == {"error": message}
+
+
+class TestLifespanResources:
+    """Tests for resolving the client outside the lifespan's context."""
+
+    async def test_tool_without_server_returns_error(self) -> None:
+        """Test a tool called with no running server reports an MCP error payload."""
+        assert orjson.loads(await server.get_issue("TEST-123")) == {
+            "error": server._NOT_RUNNING_MESSAGE
+        }
+        assert orjson.loads(await server.list_projects()) == {"error": server._NOT_RUNNING_MESSAGE}
+
+    async def test_falls_back_to_request_lifespan_context(
+        self,
+        config: YouTrackConfig,
+        sample_issue_data: dict[str, Any],
+    ) -> None:
+        """Test tools use the request's lifespan context when the vars aren't set."""
+        fake = FakeYouTrack()
+        fake.add("GET", "/issues/TEST-123", sample_issue_data)
+        transport = httpx.MockTransport(fake.handler)
+        async with YouTrackClient(config, transport=transport) as client:
+            token = request_ctx.set(
+                RequestContext(
+                    request_id=1,
+                    meta=None,
+                    session=None,
+                    lifespan_context={"client": client, "config": config},
+                )
+            )
+            try:
+                result = orjson.loads(await server.get_issue("TEST-123"))
+            finally:
+                request_ctx.reset(token)
+
+        assert result["id"] == "TEST-123"
+        assert fake.count("GET", "/issues/TEST-123") == 1